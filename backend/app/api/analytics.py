@@ -2,27 +2,74 @@
 
 import logging
 from datetime import date, datetime, timedelta
-from decimal import Decimal
-from typing import Optional
+from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from sqlalchemy import Date, DateTime, String, cast, func, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.episode import Episode, EpisodeStatus
-from app.models.logs import APIUsage, APIProvider
+from app.models.logs import APIUsage, APIUsageDaily, APIProvider
 from app.schemas.analytics import CostAnalytics, CostBreakdown, PerformanceMetrics
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _daily_usage(start_date: date, end_date: date):
+    """
+    Daily per-provider API usage for days in [start_date, end_date).
+
+    Days up to the latest one in the ``api_usage_daily`` rollup (refreshed by
+    the worker) come from it; later days, including today's partial day, are
+    aggregated from raw ``api_usage`` rows.
+    """
+    rolled_through = select(func.max(APIUsageDaily.day)).scalar_subquery()
+
+    rolled_up = select(
+        APIUsageDaily.day,
+        APIUsageDaily.provider,
+        APIUsageDaily.api_calls,
+        APIUsageDaily.cost_usd,
+        APIUsageDaily.input_tokens,
+        APIUsageDaily.output_tokens,
+        APIUsageDaily.avg_response_time_ms,
+    ).where(
+        APIUsageDaily.day >= start_date,
+        APIUsageDaily.day < end_date,
+    )
+
+    day = cast(APIUsage.created_at, Date)
+    live = (
+        select(
+            day,
+            APIUsage.provider,
+            func.count(APIUsage.id),
+            func.coalesce(func.sum(APIUsage.cost_usd), 0),
+            func.coalesce(func.sum(APIUsage.input_tokens), 0),
+            func.coalesce(func.sum(APIUsage.output_tokens), 0),
+            func.avg(func.nullif(APIUsage.response_time_ms, 0)),
+        )
+        .where(
+            # GREATEST skips the NULL from an empty rollup
+            APIUsage.created_at >= func.greatest(
+                cast(rolled_through + 1, DateTime),
+                datetime.combine(start_date, datetime.min.time()),
+            ),
+            APIUsage.created_at < datetime.combine(end_date, datetime.min.time()),
+        )
+        .group_by(day, APIUsage.provider)
+    )
+
+    return union_all(rolled_up, live).subquery()
+
+
 @router.get("/costs", response_model=list[CostAnalytics])
 async def get_costs(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    group_by: str = Query(default="day", regex="^(day|week|month|episode)$"),
+    group_by: Literal["day", "week", "month", "episode"] = "day",
     db: AsyncSession = Depends(get_db),
 ):
     """Get cost breakdown by period."""
@@ -31,31 +78,27 @@ async def get_costs(
     if not end_date:
         end_date = date.today()
 
-    # Get API usage data
-    stmt = select(APIUsage).where(
-        APIUsage.created_at >= datetime.combine(start_date, datetime.min.time()),
-        APIUsage.created_at <= datetime.combine(end_date, datetime.max.time()),
+    # Anthropic usage from the daily rollup plus the episode count, in one round trip
+    usage = _daily_usage(start_date, end_date + timedelta(days=1))
+    episodes_count = (
+        select(func.count(Episode.id))
+        .where(
+            Episode.created_at >= datetime.combine(start_date, datetime.min.time()),
+            Episode.created_at < datetime.combine(end_date + timedelta(days=1), datetime.min.time()),
+        )
+        .scalar_subquery()
     )
+    stmt = select(
+        func.sum(usage.c.cost_usd),
+        func.sum(usage.c.input_tokens + usage.c.output_tokens),
+        episodes_count,
+    ).where(usage.c.provider == APIProvider.ANTHROPIC)
     result = await db.execute(stmt)
-    usage_records = result.scalars().all()
-
-    # Aggregate by provider
-    anthropic_cost = sum(
-        (r.cost_usd or Decimal(0)) for r in usage_records if r.provider == APIProvider.ANTHROPIC
-    )
-    total_tokens = sum(
-        ((r.input_tokens or 0) + (r.output_tokens or 0))
-        for r in usage_records
-        if r.provider == APIProvider.ANTHROPIC
-    )
+    anthropic_cost, total_tokens, episodes_count = result.one()
 
-    # Count episodes
-    episode_stmt = select(func.count(Episode.id)).where(
-        Episode.created_at >= datetime.combine(start_date, datetime.min.time()),
-        Episode.created_at <= datetime.combine(end_date, datetime.max.time()),
-    )
-    episode_result = await db.execute(episode_stmt)
-    episodes_count = episode_result.scalar() or 0
+    anthropic_cost = float(anthropic_cost or 0)
+    total_tokens = total_tokens or 0
+    episodes_count = episodes_count or 0
 
     return [
         CostAnalytics(
@@ -63,9 +106,9 @@ async def get_costs(
             total_cost_usd=anthropic_cost,  # Ovi is free
             breakdown=CostBreakdown(
                 anthropic=anthropic_cost,
-                ovi=Decimal(0),  # Ovi is free
-                youtube=Decimal(0),  # YouTube API is free
-                storage=Decimal(0),  # TODO: Calculate MinIO costs
+                ovi=0,  # Ovi is free
+                youtube=0,  # YouTube API is free
+                storage=0,  # TODO: Calculate MinIO costs
             ),
             episodes_generated=episodes_count,
             total_tokens=total_tokens,
@@ -85,27 +128,22 @@ async def get_performance(
     if not end_date:
         end_date = date.today()
 
-    # Get episode stats
-    stmt = select(Episode).where(
+    # Aggregate episode stats in the database
+    stmt = select(
+        func.count(Episode.id),
+        func.count(Episode.id).filter(Episode.status == EpisodeStatus.PUBLISHED),
+        func.count(Episode.id).filter(Episode.status == EpisodeStatus.FAILED),
+        func.avg(Episode.generation_time_seconds),
+        func.avg(Episode.scene_count),
+        func.avg(Episode.total_cost_usd),
+    ).where(
         Episode.created_at >= datetime.combine(start_date, datetime.min.time()),
-        Episode.created_at <= datetime.combine(end_date, datetime.max.time()),
+        Episode.created_at < datetime.combine(end_date + timedelta(days=1), datetime.min.time()),
     )
     result = await db.execute(stmt)
-    episodes = result.scalars().all()
-
-    total = len(episodes)
-    successful = sum(1 for e in episodes if e.status == EpisodeStatus.PUBLISHED)
-    failed = sum(1 for e in episodes if e.status == EpisodeStatus.FAILED)
-
-    # Calculate averages
-    generation_times = [e.generation_time_seconds for e in episodes if e.generation_time_seconds]
-    avg_time = sum(generation_times) / len(generation_times) / 60 if generation_times else None
+    total, successful, failed, avg_seconds, avg_scenes, avg_cost = result.one()
 
-    scene_counts = [e.scene_count for e in episodes]
-    avg_scenes = sum(scene_counts) / len(scene_counts) if scene_counts else 0
-
-    costs = [e.total_cost_usd for e in episodes]
-    avg_cost = sum(costs) / len(costs) if costs else Decimal(0)
+    avg_time = float(avg_seconds) / 60 if avg_seconds is not None else None
 
     return PerformanceMetrics(
         total_episodes=total,
@@ -113,8 +151,8 @@ async def get_performance(
         failed_episodes=failed,
         success_rate=(successful / total * 100) if total > 0 else 0,
         avg_generation_time_minutes=avg_time,
-        avg_scenes_per_episode=avg_scenes,
-        avg_cost_per_episode_usd=avg_cost,
+        avg_scenes_per_episode=float(avg_scenes or 0),
+        avg_cost_per_episode_usd=float(avg_cost or 0),
     )
 
 
@@ -126,44 +164,19 @@ async def get_daily_costs(
     """Get daily cost breakdown."""
     start_date = date.today() - timedelta(days=days)
 
-    stmt = select(APIUsage).where(
-        APIUsage.created_at >= datetime.combine(start_date, datetime.min.time()),
-    ).order_by(APIUsage.created_at)
-
+    usage = _daily_usage(start_date, date.today() + timedelta(days=1))
+    stmt = select(usage).order_by(usage.c.day.desc(), cast(usage.c.provider, String).desc())
     result = await db.execute(stmt)
-    records = result.scalars().all()
-
-    # Group by date and provider
-    daily_data = {}
-    for record in records:
-        day = record.created_at.date().isoformat()
-        provider = record.provider.value
-
-        key = (day, provider)
-        if key not in daily_data:
-            daily_data[key] = {
-                "date": day,
-                "provider": provider,
-                "api_calls": 0,
-                "total_cost_usd": Decimal(0),
-                "total_input_tokens": 0,
-                "total_output_tokens": 0,
-                "response_times": [],
-            }
-
-        daily_data[key]["api_calls"] += 1
-        daily_data[key]["total_cost_usd"] += record.cost_usd or Decimal(0)
-        daily_data[key]["total_input_tokens"] += record.input_tokens or 0
-        daily_data[key]["total_output_tokens"] += record.output_tokens or 0
-        if record.response_time_ms:
-            daily_data[key]["response_times"].append(record.response_time_ms)
-
-    # Calculate averages and format response
-    results = []
-    for data in daily_data.values():
-        response_times = data.pop("response_times")
-        data["avg_response_time_ms"] = sum(response_times) / len(response_times) if response_times else 0
-        data["total_cost_usd"] = float(data["total_cost_usd"])
-        results.append(data)
-
-    return sorted(results, key=lambda x: (x["date"], x["provider"]), reverse=True)
+
+    return [
+        {
+            "date": row_day.isoformat(),
+            "provider": provider.value,
+            "api_calls": api_calls,
+            "total_cost_usd": float(cost or 0),
+            "total_input_tokens": input_tokens or 0,
+            "total_output_tokens": output_tokens or 0,
+            "avg_response_time_ms": float(avg_response_time or 0),
+        }
+        for row_day, provider, api_calls, cost, input_tokens, output_tokens, avg_response_time in result
+    ]
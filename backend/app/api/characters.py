@@ -1,13 +1,18 @@
 """Character API endpoints."""
 
+import asyncio
 import logging
-from typing import Optional
+import time
+from typing import Any, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, UploadFile
-from sqlalchemy import select
+from sqlalchemy import func, literal, literal_column, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app import cache
 from app.config import settings
 from app.database import get_db
 from app.models.character import Character, CharacterImage
@@ -17,11 +22,24 @@ from app.schemas.character import (
     CharacterResponse,
     CharacterUpdate,
 )
-from app.services.storage import StorageService
+from app.services.storage import StorageService, get_storage
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Process-local cache of serialized character lists, keyed by active_only.
+# Entries are dropped once a write to a character or its images commits.
+CHARACTER_LIST_TTL_SECONDS = 60
+_character_list_cache: dict[bool, tuple[float, list[dict[str, Any]]]] = {}
+_character_list_version = 0
+
+
+def _invalidate_character_list_cache() -> None:
+    """Drop cached character lists; queued with ``cache.call_on_commit``."""
+    global _character_list_version
+    _character_list_version += 1
+    _character_list_cache.clear()
+
 
 @router.get("", response_model=list[CharacterResponse])
 async def list_characters(
@@ -29,7 +47,34 @@ async def list_characters(
     db: AsyncSession = Depends(get_db),
 ):
     """List all characters."""
-    stmt = select(Character).options(selectinload(Character.images))
+    cached = _character_list_cache.get(active_only)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    version = _character_list_version
+
+    # Build response rows straight from columns, with images aggregated to
+    # JSON in the database, instead of loading and re-walking ORM objects.
+    image_fields = []
+    for name in CharacterImageResponse.model_fields:
+        image_fields += [literal(name), getattr(CharacterImage, name)]
+    images = (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(func.json_build_object(*image_fields), CharacterImage.id)
+                ),
+                literal_column("'[]'::json"),
+            )
+        )
+        .where(CharacterImage.character_id == Character.id)
+        .scalar_subquery()
+        .label("images")
+    )
+    stmt = select(
+        *(getattr(Character, name) for name in CharacterResponse.model_fields if name != "images"),
+        images,
+    )
     
     if active_only:
         stmt = stmt.where(Character.is_active == True)
@@ -37,7 +82,14 @@ async def list_characters(
     stmt = stmt.order_by(Character.name)
     
     result = await db.execute(stmt)
-    characters = result.scalars().all()
+    characters = [dict(row._mapping) for row in result]
+
+    # Skip caching if a write committed while we were querying
+    if version == _character_list_version:
+        _character_list_cache[active_only] = (
+            time.monotonic() + CHARACTER_LIST_TTL_SECONDS,
+            characters,
+        )
     
     return characters
 
@@ -68,15 +120,15 @@ async def create_character(
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new character."""
-    # Check for duplicate name
-    stmt = select(Character).where(Character.name == character.name)
-    result = await db.execute(stmt)
-    if result.scalar_one_or_none():
-        raise HTTPException(status_code=409, detail="Character with this name already exists")
-    
     db_character = Character(**character.model_dump())
     db.add(db_character)
-    await db.flush()
+
+    # Duplicate names are rejected by the unique constraint on characters.name
+    try:
+        await db.flush()
+    except IntegrityError:
+        raise HTTPException(status_code=409, detail="Character with this name already exists")
+    cache.call_on_commit(db, _invalidate_character_list_cache)
     
     logger.info(f"Created character: {db_character.name}")
     
@@ -98,6 +150,7 @@ async def update_character(
     update_data = character.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_character, key, value)
+    cache.call_on_commit(db, _invalidate_character_list_cache)
     
     logger.info(f"Updated character: {db_character.name}")
     
@@ -113,6 +166,7 @@ async def upload_character_image(
     is_primary: bool = Form(default=False),
     is_style_reference: bool = Form(default=False),
     db: AsyncSession = Depends(get_db),
+    storage: StorageService = Depends(get_storage),
 ):
     """Upload a character image."""
     character = await db.get(Character, character_id)
@@ -121,11 +175,25 @@ async def upload_character_image(
         raise HTTPException(status_code=404, detail="Character not found")
 
     # Upload to MinIO
-    storage = StorageService()
     object_name = f"{character.name}/{image.filename}"
 
-    content = await image.read()
-    image_path = await storage.upload_character_image(object_name, content)
+    image_path = await storage.upload_character_image(
+        object_name,
+        image.file,
+        length=image.size if image.size is not None else -1,
+    )
+
+    # Unset other primary images first so the one-primary-per-character index holds
+    if is_primary:
+        character.primary_image_path = image_path
+        await db.execute(
+            update(CharacterImage)
+            .where(
+                CharacterImage.character_id == character_id,
+                CharacterImage.is_primary == True,
+            )
+            .values(is_primary=False)
+        )
 
     # Create database record
     db_image = CharacterImage(
@@ -138,20 +206,8 @@ async def upload_character_image(
     )
     db.add(db_image)
     
-    # Update primary image if needed
-    if is_primary:
-        character.primary_image_path = image_path
-        # Unset other primary images
-        stmt = select(CharacterImage).where(
-            CharacterImage.character_id == character_id,
-            CharacterImage.is_primary == True,
-            CharacterImage.id != db_image.id,
-        )
-        result = await db.execute(stmt)
-        for other_image in result.scalars():
-            other_image.is_primary = False
-    
     await db.flush()
+    cache.call_on_commit(db, _invalidate_character_list_cache)
 
     logger.info(f"Uploaded image for character {character.name}: {image_path}")
 
@@ -162,6 +218,7 @@ async def upload_character_image(
 async def generate_character_image(
     character_id: int,
     db: AsyncSession = Depends(get_db),
+    storage: StorageService = Depends(get_storage),
 ):
     """Generate a new caricature image for a character using Gemini + style references.
 
@@ -200,14 +257,16 @@ async def generate_character_image(
     style_refs = style_result.scalars().all()
 
     # Download style reference images from MinIO
-    storage = StorageService()
+    downloads = await asyncio.gather(
+        *(storage.download_character_image(ref.image_path) for ref in style_refs),
+        return_exceptions=True,
+    )
     style_reference_paths = []
-    for ref in style_refs:
-        try:
-            local_path = await storage.download_character_image(ref.image_path)
-            style_reference_paths.append(local_path)
-        except Exception as e:
-            logger.warning(f"Could not load style ref {ref.image_path}: {e}")
+    for ref, download in zip(style_refs, downloads):
+        if isinstance(download, Exception):
+            logger.warning(f"Could not load style ref {ref.image_path}: {download}")
+        else:
+            style_reference_paths.append(download)
 
     logger.info(
         f"Generating caricature for {character.display_name} "
@@ -225,6 +284,7 @@ async def generate_character_image(
     # Save the prompt to the character record
     character.caricature_prompt = result.prompt_used
     await db.flush()
+    cache.call_on_commit(db, _invalidate_character_list_cache)
 
     return {
         "character_id": character_id,
@@ -3,8 +3,8 @@
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -18,16 +18,34 @@ from app.schemas.episode import (
     GenerateEpisodeResponse,
     RetryRequest,
 )
-from app.pipeline.video_pipeline import VideoPipeline
+from app.pipeline.tasks import enqueue_pipeline
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+async def _enqueue_or_fail(db: AsyncSession, episode_id: int, attempt: int = 0) -> None:
+    """Enqueue a committed episode; if the queue is unreachable, mark it FAILED so it can be retried."""
+    try:
+        await enqueue_pipeline(episode_id, attempt=attempt)
+    except Exception as e:
+        logger.exception(f"Failed to enqueue pipeline for episode {episode_id}")
+        await db.execute(
+            update(Episode)
+            .where(Episode.id == episode_id)
+            .values(status=EpisodeStatus.FAILED, last_error=f"Could not enqueue pipeline: {e}")
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        raise HTTPException(
+            status_code=503,
+            detail="Pipeline queue unavailable; the episode was marked failed and can be retried",
+        ) from e
+
+
 @router.post("/generate", response_model=GenerateEpisodeResponse)
 async def generate_episode(
     request: GenerateEpisodeRequest,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Trigger episode generation."""
@@ -39,19 +57,22 @@ async def generate_episode(
         raise HTTPException(status_code=404, detail="Race not found")
 
     # Check for existing episode
-    stmt = select(Episode).where(
-        Episode.race_id == request.race_id,
-        Episode.episode_type == request.episode_type,
-    )
-    result = await db.execute(stmt)
-    existing = result.scalar_one_or_none()
-
-    if existing and not request.force:
-        raise HTTPException(
-            status_code=409,
-            detail=f"Episode already exists: {existing.id}. Use force=true to regenerate.",
+    if not request.force:
+        existing_id = await db.scalar(
+            select(Episode.id)
+            .where(
+                Episode.race_id == request.race_id,
+                Episode.episode_type == request.episode_type,
+            )
+            .limit(1)
         )
 
+        if existing_id:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Episode already exists: {existing_id}. Use force=true to regenerate.",
+            )
+
     # Create new episode
     title = f"{race.race_name} - {request.episode_type.value.replace('-', ' ').title()}"
     episode = Episode(
@@ -65,8 +86,11 @@ async def generate_episode(
 
     logger.info(f"Created episode {episode.id}: {title}")
 
-    # Start pipeline in background
-    background_tasks.add_task(run_pipeline_background, episode.id)
+    # Commit before enqueueing so the worker can see the episode
+    await db.commit()
+
+    # Hand the pipeline to a queue worker
+    await _enqueue_or_fail(db, episode.id)
 
     return GenerateEpisodeResponse(
         episode_id=episode.id,
@@ -75,16 +99,6 @@ async def generate_episode(
     )
 
 
-async def run_pipeline_background(episode_id: int):
-    """Run video pipeline in background."""
-    logger.info(f"Starting background pipeline for episode {episode_id}")
-    try:
-        pipeline = VideoPipeline(episode_id)
-        await pipeline.run()
-    except Exception as e:
-        logger.error(f"Pipeline failed for episode {episode_id}: {e}")
-
-
 @router.get("", response_model=list[EpisodeResponse])
 async def list_episodes(
     status: Optional[EpisodeStatus] = None,
@@ -94,7 +108,7 @@ async def list_episodes(
     db: AsyncSession = Depends(get_db),
 ):
     """List episodes with filtering."""
-    stmt = select(Episode).options(selectinload(Episode.race))
+    stmt = select(Episode, Race.race_name).outerjoin(Race, Episode.race_id == Race.id)
 
     if status:
         stmt = stmt.where(Episode.status == status)
@@ -104,13 +118,12 @@ async def list_episodes(
     stmt = stmt.order_by(Episode.created_at.desc()).offset(offset).limit(limit)
 
     result = await db.execute(stmt)
-    episodes = result.scalars().all()
 
     return [
         EpisodeResponse(
             id=ep.id,
             race_id=ep.race_id,
-            race_name=ep.race.race_name if ep.race else None,
+            race_name=race_name,
             episode_type=ep.episode_type,
             title=ep.title,
             status=ep.status,
@@ -119,7 +132,7 @@ async def list_episodes(
             created_at=ep.created_at,
             published_at=ep.published_at,
         )
-        for ep in episodes
+        for ep, race_name in result
     ]
 
 
@@ -147,21 +160,32 @@ async def get_episode(
 async def retry_episode(
     episode_id: int,
     request: RetryRequest,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Retry failed episode or specific scenes."""
-    episode = await db.get(Episode, episode_id)
-    if not episode:
-        raise HTTPException(status_code=404, detail="Episode not found")
-
     logger.info(f"Retry request for episode {episode_id}, scenes: {request.scene_ids or 'all failed'}")
 
-    # Reset episode status
-    episode.status = EpisodeStatus.GENERATING
-    episode.retry_count += 1
+    # Only a FAILED episode can be retried; claiming it in one UPDATE keeps
+    # concurrent retries (or a retry during a run) from starting a second pipeline
+    retry_count = await db.scalar(
+        update(Episode)
+        .where(Episode.id == episode_id, Episode.status == EpisodeStatus.FAILED)
+        .values(status=EpisodeStatus.GENERATING, retry_count=Episode.retry_count + 1)
+        .returning(Episode.retry_count)
+        .execution_options(synchronize_session=False)
+    )
+    if retry_count is None:
+        status = await db.scalar(select(Episode.status).where(Episode.id == episode_id))
+        if status is None:
+            raise HTTPException(status_code=404, detail="Episode not found")
+        raise HTTPException(
+            status_code=409,
+            detail=f"Only failed episodes can be retried (status: {status.value})",
+        )
+
+    await db.commit()
 
-    # Start retry in background
-    background_tasks.add_task(run_pipeline_background, episode.id)
+    # Hand the retry to a queue worker
+    await _enqueue_or_fail(db, episode_id, attempt=retry_count)
 
     return {"status": "retry_started", "episode_id": episode_id}
@@ -1,17 +1,24 @@
 """Running gags API endpoints."""
 
 import logging
+import re
+from functools import lru_cache
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import Integer, and_, any_, case, delete, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
+from app import cache
 from app.database import get_db
-from app.models.gag import GagUsage, RunningGag
+from app.models.gag import GagStatus, GagUsage, RunningGag
 from app.schemas.gag import (
     GagCreate,
+    GagDetailResponse,
     GagResponse,
     GagUpdate,
     GagUsageCreate,
@@ -21,9 +28,45 @@ from app.schemas.gag import (
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Built once; list endpoints serialize straight to JSON with it
+_gag_list_adapter = TypeAdapter(list[GagResponse])
+
+
+MAX_CHARACTER_IDS = 64
+_ID_SPLIT = re.compile(r"[,\s]+")
+
+
+@lru_cache(maxsize=256)
+def _parse_character_ids(character_ids: str) -> tuple[int, ...]:
+    """Parse a comma-separated character ID list, rejecting oversized or malformed input."""
+    parts = _ID_SPLIT.split(character_ids.strip(), maxsplit=MAX_CHARACTER_IDS)
+    if len(parts) > MAX_CHARACTER_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_CHARACTER_IDS} character IDs allowed")
+    try:
+        return tuple(map(int, parts))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="character_ids must be comma-separated integers")
+
+
+ACTIVE_TITLE_CONSTRAINT = "uq_running_gags_active_title"
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+def _gag_write_error(error: IntegrityError) -> HTTPException:
+    """Map a gag insert/update IntegrityError to an HTTP error, re-raising unknown ones."""
+    # asyncpg's error carries the constraint name; SQLAlchemy 2.1 exposes it
+    # as .orig, 2.0 chains it as __cause__
+    driver_error = getattr(error.orig, "orig", None) or error.orig.__cause__
+    if getattr(driver_error, "constraint_name", None) == ACTIVE_TITLE_CONSTRAINT:
+        return HTTPException(status_code=409, detail="An active gag with this title already exists")
+    if getattr(error.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION:
+        return HTTPException(status_code=422, detail="Referenced character or episode does not exist")
+    raise error
+
 
 @router.get("", response_model=list[GagResponse])
 async def list_gags(
+    request: Request,
     active_only: bool = True,
     character_id: Optional[int] = Query(None, description="Filter by character"),
     category: Optional[str] = Query(None, description="Filter by category"),
@@ -31,30 +74,56 @@ async def list_gags(
     db: AsyncSession = Depends(get_db),
 ):
     """List running gags with optional filters."""
-    stmt = select(RunningGag).options(selectinload(RunningGag.usages))
+    filters = []
 
     if active_only:
-        stmt = stmt.where(RunningGag.is_active == True)
+        filters.append(RunningGag.is_active == True)
 
     if character_id:
-        stmt = stmt.where(
+        filters.append(
             (RunningGag.primary_character_id == character_id)
             | (RunningGag.secondary_character_id == character_id)
         )
 
     if category:
-        stmt = stmt.where(RunningGag.category == category)
+        filters.append(RunningGag.category == category)
 
     if status:
-        stmt = stmt.where(RunningGag.status == status)
+        filters.append(RunningGag.status == status)
+
+    # Version the listing by row count and latest update so pollers get a 304
+    async def load_version():
+        count, last_updated = (
+            await db.execute(select(func.count(), func.max(RunningGag.updated_at)).where(*filters))
+        ).one()
+        return [count, last_updated.isoformat() if last_updated else None]
+
+    version = await cache.get_or_set(
+        f"gags:etag:{active_only}:{character_id}:{category}:{status}",
+        load_version,
+        ttl=cache.ETAG_TTL_SECONDS,
+    )
+    etag = cache.make_etag(*version)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
 
-    stmt = stmt.order_by(RunningGag.humor_rating.desc(), RunningGag.created_at.desc())
+    stmt = (
+        select(RunningGag)
+        .options(raiseload("*"))
+        .where(*filters)
+        .order_by(RunningGag.humor_rating.desc(), RunningGag.created_at.desc())
+    )
 
     result = await db.execute(stmt)
-    return result.scalars().all()
+    gags = _gag_list_adapter.validate_python(result.scalars().all(), from_attributes=True)
+    return Response(
+        _gag_list_adapter.dump_json(gags),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
-@router.get("/{gag_id}", response_model=GagResponse)
+@router.get("/{gag_id}", response_model=GagDetailResponse)
 async def get_gag(
     gag_id: int,
     db: AsyncSession = Depends(get_db),
@@ -62,7 +131,7 @@ async def get_gag(
     """Get a running gag by ID."""
     stmt = (
         select(RunningGag)
-        .options(selectinload(RunningGag.usages))
+        .options(selectinload(RunningGag.usages), raiseload("*"))
         .where(RunningGag.id == gag_id)
     )
     result = await db.execute(stmt)
@@ -74,7 +143,7 @@ async def get_gag(
     return gag
 
 
-@router.post("", response_model=GagResponse)
+@router.post("", response_model=GagDetailResponse)
 async def create_gag(
     gag: GagCreate,
     db: AsyncSession = Depends(get_db),
@@ -82,22 +151,23 @@ async def create_gag(
     """Create a new running gag."""
     db_gag = RunningGag(**gag.model_dump())
     db.add(db_gag)
-    await db.flush()
 
-    # Reload with usages relationship for response
-    stmt = (
-        select(RunningGag)
-        .options(selectinload(RunningGag.usages))
-        .where(RunningGag.id == db_gag.id)
-    )
-    result = await db.execute(stmt)
-    db_gag = result.scalar_one()
+    # Duplicate active titles are rejected by uq_running_gags_active_title
+    try:
+        await db.flush()
+    except IntegrityError as e:
+        raise _gag_write_error(e)
+
+    # Load the usages relationship for the response
+    await db.refresh(db_gag, attribute_names=["usages"])
 
     logger.info(f"Created running gag: {db_gag.title}")
+
+    cache.invalidate_on_commit(db, "gags:episode:*")
     return db_gag
 
 
-@router.put("/{gag_id}", response_model=GagResponse)
+@router.put("/{gag_id}", response_model=GagDetailResponse)
 async def update_gag(
     gag_id: int,
     gag: GagUpdate,
@@ -113,18 +183,17 @@ async def update_gag(
     for key, value in update_data.items():
         setattr(db_gag, key, value)
 
-    await db.flush()
+    try:
+        await db.flush()
+    except IntegrityError as e:
+        raise _gag_write_error(e)
 
-    # Reload with usages relationship for response
-    stmt = (
-        select(RunningGag)
-        .options(selectinload(RunningGag.usages))
-        .where(RunningGag.id == gag_id)
-    )
-    result = await db.execute(stmt)
-    db_gag = result.scalar_one()
+    # Load the usages relationship for the response
+    await db.refresh(db_gag, attribute_names=["usages"])
 
     logger.info(f"Updated running gag: {db_gag.title}")
+
+    cache.invalidate_on_commit(db, "gags:episode:*")
     return db_gag
 
 
@@ -134,14 +203,20 @@ async def delete_gag(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a running gag."""
-    db_gag = await db.get(RunningGag, gag_id)
+    # Usages go with it via ON DELETE CASCADE on gag_usage.gag_id
+    title = await db.scalar(
+        delete(RunningGag)
+        .where(RunningGag.id == gag_id)
+        .returning(RunningGag.title)
+        .execution_options(synchronize_session=False)
+    )
 
-    if not db_gag:
+    if title is None:
         raise HTTPException(status_code=404, detail="Gag not found")
 
-    await db.delete(db_gag)
-    logger.info(f"Deleted running gag: {db_gag.title}")
+    logger.info(f"Deleted running gag: {title}")
 
+    cache.invalidate_on_commit(db, "gags:episode:*")
     return {"detail": "Gag deleted"}
 
 
@@ -152,9 +227,32 @@ async def record_gag_usage(
     db: AsyncSession = Depends(get_db),
 ):
     """Record a gag being used in an episode."""
-    db_gag = await db.get(RunningGag, gag_id)
+    # Update gag tracking atomically so concurrent usages are not lost
+    times_used = RunningGag.times_used + 1
+    stmt = (
+        update(RunningGag)
+        .where(RunningGag.id == gag_id)
+        .values(
+            times_used=times_used,
+            # Transaction time in UTC, matching the naive utcnow() timestamps elsewhere
+            last_used_at=func.timezone("utc", func.now()),
+            last_used_in_episode_id=usage.episode_id,
+            audience_familiarity=func.least(10, RunningGag.audience_familiarity + 1),
+            status=case(
+                (
+                    and_(RunningGag.max_uses > 0, times_used >= RunningGag.max_uses),
+                    literal(GagStatus.EXHAUSTED, RunningGag.status.type),
+                ),
+                else_=RunningGag.status,
+            ),
+        )
+        .returning(RunningGag.title, RunningGag.times_used)
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    updated = result.one_or_none()
 
-    if not db_gag:
+    if not updated:
         raise HTTPException(status_code=404, detail="Gag not found")
 
     # Create usage record
@@ -168,20 +266,10 @@ async def record_gag_usage(
     )
     db.add(db_usage)
 
-    # Update gag tracking
-    from datetime import datetime
-    db_gag.times_used += 1
-    db_gag.last_used_at = datetime.utcnow()
-    db_gag.last_used_in_episode_id = usage.episode_id
-    db_gag.audience_familiarity = min(10, db_gag.audience_familiarity + 1)
-
-    # Check if exhausted
-    if db_gag.max_uses and db_gag.times_used >= db_gag.max_uses:
-        db_gag.status = "exhausted"
-
     await db.flush()
-    logger.info(f"Recorded usage of gag '{db_gag.title}' (used {db_gag.times_used} times)")
+    logger.info(f"Recorded usage of gag '{updated.title}' (used {updated.times_used} times)")
 
+    cache.invalidate_on_commit(db, "gags:episode:*")
     return db_usage
 
 
@@ -196,35 +284,40 @@ async def get_available_gags_for_episode(
     This is used by the script generator to find relevant gags
     that can be referenced in the current episode.
     """
-    stmt = (
-        select(RunningGag)
-        .options(selectinload(RunningGag.usages))
-        .where(RunningGag.is_active == True)
-        .where(RunningGag.status.in_(["active", "cooling_down"]))
-    )
-
-    # Filter by characters in this episode
-    if character_ids:
-        char_id_list = [int(x) for x in character_ids.split(",")]
-        stmt = stmt.where(
-            (RunningGag.primary_character_id.in_(char_id_list))
-            | (RunningGag.secondary_character_id.in_(char_id_list))
-            | (RunningGag.primary_character_id.is_(None))  # Universal gags
+    char_id_list = _parse_character_ids(character_ids) if character_ids else ()
+
+    async def load():
+        stmt = (
+            select(RunningGag)
+            .options(raiseload("*"))
+            .where(RunningGag.is_active == True)
+            .where(
+                or_(
+                    RunningGag.status == GagStatus.ACTIVE,
+                    # Cooling-down gags that have been used; the script generator decides
+                    and_(
+                        RunningGag.status == GagStatus.COOLING_DOWN,
+                        RunningGag.times_used > 0,
+                        RunningGag.last_used_at.is_not(None),
+                    ),
+                )
+            )
         )
 
-    stmt = stmt.order_by(RunningGag.humor_rating.desc())
+        # Filter by characters in this episode
+        if char_id_list:
+            # One array parameter keeps a single prepared statement for any list length
+            char_ids = literal(list(char_id_list), ARRAY(Integer))
+            stmt = stmt.where(
+                (RunningGag.primary_character_id == any_(char_ids))
+                | (RunningGag.secondary_character_id == any_(char_ids))
+                | (RunningGag.primary_character_id.is_(None))  # Universal gags
+            )
 
-    result = await db.execute(stmt)
-    gags = result.scalars().all()
-
-    # Filter out gags still in cooldown
-    available = []
-    for gag in gags:
-        if gag.status == "active":
-            available.append(gag)
-        elif gag.status == "cooling_down":
-            # Check if cooldown period has passed (simplified - count episodes since last use)
-            if gag.times_used > 0 and gag.last_used_at:
-                available.append(gag)  # Let the script generator decide
-
-    return available
+        stmt = stmt.order_by(RunningGag.humor_rating.desc())
+
+        result = await db.execute(stmt)
+        return [GagResponse.model_validate(gag).model_dump(mode="json") for gag in result.scalars().all()]
+
+    ids_key = ",".join(map(str, char_id_list))
+    return await cache.get_or_set(f"gags:episode:{episode_type}:{ids_key}", load)
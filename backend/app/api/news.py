@@ -2,10 +2,14 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, desc
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, select, desc, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload, undefer_group
 
+from app import cache
+from app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 from app.database import get_db
 from app.models import NewsSource, NewsArticle, ArticleContext
 from app.models.scheduler import JobTriggerType
@@ -14,6 +18,7 @@ from app.schemas.news import (
     NewsSourceCreate,
     NewsSourceResponse,
     NewsArticleResponse,
+    NewsArticleSummary,
     NewsArticleWithSource,
     ScrapeRequest,
     ScrapeResponse,
@@ -21,6 +26,15 @@ from app.schemas.news import (
 
 router = APIRouter(prefix="/news", tags=["News"])
 
+# Built once; list endpoints serialize straight to JSON with it
+_article_list_adapter = TypeAdapter(List[NewsArticleSummary])
+
+# The listing reads only the summary columns; the deferred "heavy" group
+# (full text and extracted keywords/mentions) is for the detail endpoints
+_ARTICLE_LIST_COLUMNS = [
+    column for column in NewsArticle.__table__.columns if column.key in NewsArticleSummary.model_fields
+]
+
 
 # ============================================
 # NEWS SOURCES
@@ -32,12 +46,18 @@ async def list_sources(
     session: AsyncSession = Depends(get_db),
 ):
     """List all news sources."""
-    query = select(NewsSource).order_by(desc(NewsSource.priority))
-    if active_only:
-        query = query.where(NewsSource.is_active == True)
-    
-    result = await session.execute(query)
-    return result.scalars().all()
+    async def load():
+        query = select(*NewsSource.__table__.columns).order_by(desc(NewsSource.priority))
+        if active_only:
+            query = query.where(NewsSource.is_active == True)
+
+        result = await session.execute(query)
+        return [
+            NewsSourceResponse.model_validate(source).model_dump(mode="json")
+            for source in result.mappings().all()
+        ]
+
+    return await cache.get_or_set(f"news:sources:{active_only}", load)
 
 
 @router.post("/sources", response_model=NewsSourceResponse)
@@ -48,8 +68,9 @@ async def create_source(
     """Add a new news source."""
     source = NewsSource(**source_data.model_dump())
     session.add(source)
-    await session.commit()
+    await session.flush()
     await session.refresh(source)
+    cache.invalidate_on_commit(session, "news:sources:*")
     return source
 
 
@@ -74,8 +95,9 @@ async def update_source(
     if priority is not None:
         source.priority = priority
     
-    await session.commit()
+    await session.flush()
     await session.refresh(source)
+    cache.invalidate_on_commit(session, "news:sources:*")
     return source
 
 
@@ -85,16 +107,24 @@ async def delete_source(
     session: AsyncSession = Depends(get_db),
 ):
     """Delete a news source."""
-    result = await session.execute(
-        select(NewsSource).where(NewsSource.id == source_id)
+    # Keep the source's articles, detached from it
+    await session.execute(
+        update(NewsArticle)
+        .where(NewsArticle.source_id == source_id)
+        .values(source_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    deleted_id = await session.scalar(
+        delete(NewsSource)
+        .where(NewsSource.id == source_id)
+        .returning(NewsSource.id)
+        .execution_options(synchronize_session=False)
     )
-    source = result.scalar_one_or_none()
     
-    if not source:
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="Source not found")
     
-    await session.delete(source)
-    await session.commit()
+    cache.invalidate_on_commit(session, "news:sources:*")
     return {"status": "deleted"}
 
 
@@ -102,30 +132,66 @@ async def delete_source(
 # NEWS ARTICLES
 # ============================================
 
-@router.get("/articles", response_model=List[NewsArticleResponse])
+@router.get("/articles", response_model=List[NewsArticleSummary])
 async def list_articles(
+    request: Request,
     context: Optional[ArticleContext] = None,
     source_id: Optional[int] = None,
     used: Optional[bool] = None,
     limit: int = Query(default=50, le=200),
+    after: Optional[str] = Query(default=None, description="Cursor from the previous page's X-Next-Cursor"),
     session: AsyncSession = Depends(get_db),
 ):
-    """List news articles with filters."""
-    query = select(NewsArticle).order_by(desc(NewsArticle.scraped_at))
+    """List news articles with filters, newest first."""
+    filters = []
     
     if context:
-        query = query.where(NewsArticle.context == context)
+        filters.append(NewsArticle.context == context)
     if source_id:
-        query = query.where(NewsArticle.source_id == source_id)
+        filters.append(NewsArticle.source_id == source_id)
     if used is not None:
         if used:
-            query = query.where(NewsArticle.used_in_episode_id.is_not(None))
+            filters.append(NewsArticle.used_in_episode_id.is_not(None))
         else:
-            query = query.where(NewsArticle.used_in_episode_id.is_(None))
+            filters.append(NewsArticle.used_in_episode_id.is_(None))
     
-    query = query.limit(limit)
+    # Version the listing by row count and latest update so pollers get a 304
+    async def load_version():
+        count, last_updated = (
+            await session.execute(select(func.count(), func.max(NewsArticle.updated_at)).where(*filters))
+        ).one()
+        return [count, last_updated.isoformat() if last_updated else None]
+
+    version = await cache.get_or_set(
+        f"news:articles:etag:{context}:{source_id}:{used}",
+        load_version,
+        ttl=cache.ETAG_TTL_SECONDS,
+    )
+    etag = cache.make_etag(limit, after, *version)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    # Plain column rows; no ORM instances are needed for a flat listing
+    query = (
+        select(*_ARTICLE_LIST_COLUMNS)
+        .where(*filters)
+        .order_by(desc(NewsArticle.scraped_at), desc(NewsArticle.id))
+        .limit(limit)
+    )
+    if after:
+        query = query.where(tuple_(NewsArticle.scraped_at, NewsArticle.id) < decode_cursor(after))
+
     result = await session.execute(query)
-    return result.scalars().all()
+    articles = _article_list_adapter.validate_python(result.mappings().all())
+
+    headers = {"ETag": etag}
+    if len(articles) == limit:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(articles[-1].scraped_at, articles[-1].id)
+    return Response(
+        _article_list_adapter.dump_json(articles),
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 @router.get("/articles/{article_id}", response_model=NewsArticleWithSource)
@@ -135,7 +201,9 @@ async def get_article(
 ):
     """Get a specific article with source details."""
     result = await session.execute(
-        select(NewsArticle).where(NewsArticle.id == article_id)
+        select(NewsArticle)
+        .options(selectinload(NewsArticle.source), undefer_group("heavy"), raiseload("*"))
+        .where(NewsArticle.id == article_id)
     )
     article = result.scalar_one_or_none()
     
@@ -164,14 +232,11 @@ async def fetch_article_content(
         raise HTTPException(status_code=404, detail="Article not found")
     
     scraper = NewsScraperService(session)
-    try:
-        content = await scraper.fetch_article_content(article)
-        return {
-            "status": "success" if content else "no_content",
-            "content_length": len(content) if content else 0,
-        }
-    finally:
-        await scraper.close()
+    content = await scraper.fetch_article_content(article)
+    return {
+        "status": "success" if content else "no_content",
+        "content_length": len(content) if content else 0,
+    }
 
 
 # ============================================
@@ -216,10 +281,9 @@ async def scrape_news(
         )
         
         # Count sources
-        sources = await session.execute(
-            select(NewsSource).where(NewsSource.is_active == True)
-        )
-        source_count = len(sources.scalars().all())
+        source_count = await session.scalar(
+            select(func.count()).select_from(NewsSource).where(NewsSource.is_active == True)
+        ) or 0
         
         return ScrapeResponse(
             articles_scraped=len(articles),
@@ -233,8 +297,6 @@ async def scrape_news(
             sources_checked=0,
             errors=errors,
         )
-    finally:
-        await scraper.close()
 
 
 @router.get("/for-episode", response_model=List[NewsArticleResponse])
@@ -246,12 +308,8 @@ async def get_articles_for_episode(
 ):
     """Get relevant articles for generating a specific episode type."""
     scraper = NewsScraperService(session)
-    try:
-        articles = await scraper.get_articles_for_episode(
-            trigger_type=trigger_type,
-            race_id=race_id,
-            limit=limit,
-        )
-        return articles
-    finally:
-        await scraper.close()
+    return await scraper.get_articles_for_episode(
+        trigger_type=trigger_type,
+        race_id=race_id,
+        limit=limit,
+    )
@@ -0,0 +1,23 @@
+"""Keyset (seek) pagination helpers for list endpoints."""
+
+import base64
+from datetime import datetime
+
+from fastapi import HTTPException
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    raw = f"{sort_value.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor from ``encode_cursor`` into ``(sort_value, row_id)``."""
+    try:
+        sort_value, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -3,7 +3,8 @@
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +15,9 @@ from app.schemas.race import RaceCreate, RaceResponse
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Built once; list endpoints serialize straight to JSON with it
+_race_list_adapter = TypeAdapter(list[RaceResponse])
+
 
 @router.get("", response_model=list[RaceResponse])
 async def list_races(
@@ -25,7 +29,8 @@ async def list_races(
     """List races with optional filtering."""
     from datetime import date
 
-    stmt = select(Race)
+    # Plain column rows; no ORM instances are needed for a flat listing
+    stmt = select(*Race.__table__.columns)
 
     if season:
         stmt = stmt.where(Race.season == season)
@@ -36,9 +41,8 @@ async def list_races(
     stmt = stmt.order_by(Race.race_date).limit(limit)
 
     result = await db.execute(stmt)
-    races = result.scalars().all()
-
-    return races
+    races = _race_list_adapter.validate_python(result.mappings().all())
+    return Response(_race_list_adapter.dump_json(races), media_type="application/json")
 
 
 @router.get("/{race_id}", response_model=RaceResponse)
@@ -3,9 +3,11 @@
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 from app.database import get_db
 from app.models import ScheduledJob, JobStatus
 from app.services import SchedulerService
@@ -20,6 +22,9 @@ from app.schemas.scheduler import (
 
 router = APIRouter(prefix="/scheduler", tags=["Scheduler"])
 
+# Built once; list endpoints serialize straight to JSON with it
+_job_list_adapter = TypeAdapter(List[ScheduledJobResponse])
+
 
 @router.post("/sync", response_model=CalendarSyncResponse)
 async def sync_calendar(
@@ -44,18 +49,27 @@ async def sync_calendar(
 async def list_jobs(
     status: Optional[JobStatus] = Query(default=None),
     limit: int = Query(default=50, le=100),
+    after: Optional[str] = Query(default=None, description="Cursor from the previous page's X-Next-Cursor"),
     session: AsyncSession = Depends(get_db),
 ):
-    """List scheduled jobs with optional status filter."""
-    from sqlalchemy import select, desc
+    """List scheduled jobs with optional status filter, latest first."""
+    from sqlalchemy import select, desc, tuple_
     
-    query = select(ScheduledJob)
+    # Plain column rows; no ORM instances are needed for a flat listing
+    query = select(*ScheduledJob.__table__.columns)
     if status:
         query = query.where(ScheduledJob.status == status)
-    query = query.order_by(desc(ScheduledJob.scheduled_for)).limit(limit)
+    if after:
+        query = query.where(tuple_(ScheduledJob.scheduled_for, ScheduledJob.id) < decode_cursor(after))
+    query = query.order_by(desc(ScheduledJob.scheduled_for), desc(ScheduledJob.id)).limit(limit)
     
     result = await session.execute(query)
-    return result.scalars().all()
+    jobs = _job_list_adapter.validate_python(result.mappings().all())
+
+    headers = {}
+    if len(jobs) == limit:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(jobs[-1].scheduled_for, jobs[-1].id)
+    return Response(_job_list_adapter.dump_json(jobs), media_type="application/json", headers=headers)
 
 
 @router.get("/jobs/upcoming", response_model=UpcomingJobsResponse)
@@ -88,7 +102,10 @@ async def get_pending_jobs(
     """Get jobs that are ready to run (scheduled time has passed)."""
     service = SchedulerService(session)
     jobs = await service.get_pending_jobs(limit)
-    return jobs
+    return Response(
+        _job_list_adapter.dump_json(_job_list_adapter.validate_python(jobs, from_attributes=True)),
+        media_type="application/json",
+    )
 
 
 @router.get("/jobs/{job_id}", response_model=ScheduledJobWithRace)
@@ -98,9 +115,12 @@ async def get_job(
 ):
     """Get a specific scheduled job."""
     from sqlalchemy import select
+    from sqlalchemy.orm import raiseload, selectinload
     
     result = await session.execute(
-        select(ScheduledJob).where(ScheduledJob.id == job_id)
+        select(ScheduledJob)
+        .options(selectinload(ScheduledJob.race), raiseload("*"))
+        .where(ScheduledJob.id == job_id)
     )
     job = result.scalar_one_or_none()
     
@@ -124,7 +144,7 @@ async def create_job(
     """Manually create a scheduled job."""
     job = ScheduledJob(**job_data.model_dump())
     session.add(job)
-    await session.commit()
+    await session.flush()
     await session.refresh(job)
     return job
 
@@ -150,7 +170,7 @@ async def update_job(
     for key, value in update_data.items():
         setattr(job, key, value)
     
-    await session.commit()
+    await session.flush()
     await session.refresh(job)
     return job
 
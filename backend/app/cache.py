@@ -0,0 +1,101 @@
+"""Redis read-through cache for hot, rarely-changing API responses.
+
+Values are stored as JSON with a TTL. Writers queue key patterns with
+``invalidate_on_commit`` (and process-local caches queue callbacks with
+``call_on_commit``); ``get_db`` runs them after it commits.
+Redis errors are logged and treated as a cache miss, so the API keeps
+working (uncached) if Redis is unavailable.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300
+ETAG_TTL_SECONDS = 5
+
+# Session.info keys holding patterns to invalidate and callbacks to run
+# once the session commits
+_PENDING_KEY = "cache_invalidations"
+_CALLBACKS_KEY = "cache_commit_callbacks"
+
+_redis: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """Get the shared async Redis client, created on first use."""
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(settings.REDIS_URL)
+    return _redis
+
+
+async def get_or_set(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: int = DEFAULT_TTL_SECONDS,
+) -> Any:
+    """
+    Return the cached value for ``key``, calling ``loader`` on a miss.
+
+    ``loader`` must return a JSON-serializable value.
+    """
+    try:
+        cached = await get_redis().get(key)
+    except RedisError as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return await loader()
+
+    if cached is not None:
+        return json.loads(cached)
+
+    value = await loader()
+    try:
+        await get_redis().set(key, json.dumps(value), ex=ttl)
+    except RedisError as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+    return value
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a quoted HTTP ETag from the parts that version a response."""
+    digest = hashlib.md5(json.dumps(parts, default=str).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+async def invalidate(pattern: str) -> None:
+    """Delete every cached key matching a glob ``pattern``."""
+    try:
+        redis = get_redis()
+        keys = [key async for key in redis.scan_iter(match=pattern)]
+        if keys:
+            await redis.delete(*keys)
+    except RedisError as e:
+        logger.warning(f"Cache invalidation failed for {pattern}: {e}")
+
+
+def invalidate_on_commit(session: AsyncSession, pattern: str) -> None:
+    """Queue ``pattern`` for invalidation after ``session`` commits."""
+    session.info.setdefault(_PENDING_KEY, set()).add(pattern)
+
+
+def call_on_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Queue ``callback`` to run after ``session`` commits; queued once per session."""
+    session.info.setdefault(_CALLBACKS_KEY, set()).add(callback)
+
+
+async def invalidate_pending(session: AsyncSession) -> None:
+    """Invalidate the patterns and run the callbacks queued on ``session``; call after commit."""
+    for pattern in session.info.pop(_PENDING_KEY, ()):
+        await invalidate(pattern)
+    for callback in session.info.pop(_CALLBACKS_KEY, ()):
+        callback()
@@ -1,8 +1,10 @@
 """Application configuration and settings."""
 
+import logging
 from functools import lru_cache
 from typing import Optional
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -21,6 +23,27 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     LOG_LEVEL: str = "INFO"
 
+    @field_validator("LOG_LEVEL")
+    @classmethod
+    def validate_log_level(cls, value: str) -> str:
+        """Accept any stdlib level name, case-insensitively."""
+        name = value.strip().upper()
+        if name not in logging.getLevelNamesMapping():
+            raise ValueError(f"must be one of {', '.join(logging.getLevelNamesMapping())}, got {value!r}")
+        return name
+
+    @property
+    def log_level(self) -> int:
+        """Numeric logging level for LOG_LEVEL (used by the API and the worker)."""
+        return logging.getLevelNamesMapping()[self.LOG_LEVEL]
+
+    # CORS (dashboard origins allowed to call the API from the browser)
+    CORS_ORIGINS: list[str] = [
+        "https://f1.antikythera.co.za",
+        "http://localhost:3000",
+        "http://localhost:3001",
+    ]
+
     # Database
     DATABASE_HOST: str = "postgres.antikythera.co.za"
     DATABASE_PORT: int = 5432
@@ -28,6 +51,10 @@ class Settings(BaseSettings):
     DATABASE_USER: str = ""
     DATABASE_PASSWORD: str = ""
     DATABASE_URL: Optional[str] = None
+    DATABASE_POOL_SIZE: int = 20
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_RECYCLE_SECONDS: int = 1800
+    DATABASE_STATEMENT_CACHE_SIZE: int = 1024
 
     @property
     def database_url(self) -> str:
@@ -71,6 +98,7 @@ class Settings(BaseSettings):
     OVI_SPACE: str = "alexnasa/Ovi-ZEROGPU"  # Working space with API params
     OVI_TIMEOUT_SECONDS: int = 300
     OVI_QUALITY: str = "standard"  # draft, standard, high, ultra
+    OVI_PARALLELISM: int = 1  # Concurrent Ovi requests (ZeroGPU spaces queue per GPU)
     HUGGINGFACE_TOKEN: str = ""  # HF token for private spaces
 
     # YouTube API
@@ -81,6 +109,12 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Pipeline task queue (RQ)
+    PIPELINE_QUEUE_NAME: str = "pipeline"
+    PIPELINE_JOB_TIMEOUT_SECONDS: int = 7200
+    # The worker refreshes the api_usage_daily rollup on this interval
+    USAGE_ROLLUP_INTERVAL_SECONDS: int = 3600
+
     # Video Generation Settings
     VIDEO_SCENE_COUNT: int = 24
     VIDEO_SCENE_DURATION_SECONDS: int = 5
@@ -1,11 +1,15 @@
 """Database configuration and session management."""
 
+import asyncio
+import enum
 import logging
 from typing import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
+from app import cache
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -13,7 +17,15 @@ logger = logging.getLogger(__name__)
 
 class Base(DeclarativeBase):
     """Base class for SQLAlchemy models."""
-    pass
+
+    # Fetch server-generated timestamps with RETURNING on INSERT/UPDATE, so
+    # reading them after a flush never triggers a lazy load
+    __mapper_args__ = {"eager_defaults": True}
+
+
+def enum_values(enum_cls: type[enum.Enum]) -> list[str]:
+    """Persist enum members by value; shared ``values_callable`` for model Enums."""
+    return [member.value for member in enum_cls]
 
 
 # Create async engine
@@ -21,8 +33,19 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.DEBUG,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE_SECONDS,
+    # Reuse the most recently returned connection so idle ones age out and recycle
+    pool_use_lifo=True,
+    connect_args={
+        # Reuse prepared statements for the repeated endpoint queries
+        "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        # JIT compilation only adds latency for short OLTP queries. Timestamp
+        # columns are naive UTC, so NOW() defaults must be evaluated in UTC.
+        "server_settings": {"jit": "off", "timezone": "UTC"},
+    },
 )
 
 # Create async session factory
@@ -46,6 +69,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         try:
             yield session
             await session.commit()
+            await cache.invalidate_pending(session)
         except Exception as e:
             await session.rollback()
             logger.error(f"Database session error: {e}")
@@ -59,3 +83,12 @@ async def init_db() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     logger.info("Database tables initialized")
+
+
+async def warm_pool() -> None:
+    """Open the pool's connections up front so early requests skip the connect."""
+    async def ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(settings.DATABASE_POOL_SIZE)))
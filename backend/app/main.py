@@ -1,44 +1,109 @@
 """FastAPI application entry point."""
 
 import logging
+import os
+import queue
 from contextlib import asynccontextmanager
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 
+import anyio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import episodes, characters, races, analytics, scheduler, news, gags
+from app.api.pagination import NEXT_CURSOR_HEADER
 from app.config import settings
-from app.database import engine
+from app.database import engine, warm_pool
+from app.services.news_scraper import close_http_client
 from app.models import Base
 
-# Configure logging
+# Configure logging. The calling thread only merges the message args and
+# queues the record; timestamp formatting and the stream/file writes happen
+# on a QueueListener thread (started in lifespan) off the event loop.
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Per-record process/thread lookups are never part of the log format
+logging.logProcesses = False
+logging.logThreads = False
+logging.logMultiprocessing = False
+
+
+class HotPathFilter(logging.Filter):
+    """Drop high-volume SQL and access logs unless running in debug mode."""
+
+    NOISY_LOGGERS = ("sqlalchemy.engine", "uvicorn.access")
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return settings.DEBUG or not record.name.startswith(self.NOISY_LOGGERS)
+
+
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+queue_handler = QueueHandler(log_queue)
+queue_handler.addFilter(HotPathFilter())
+queue_handler.setFormatter(logging.Formatter("%(message)s"))
 logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("app.log") if settings.APP_ENV == "production" else logging.NullHandler(),
-    ],
+    level=settings.log_level,
+    handlers=[queue_handler],
 )
 
 logger = logging.getLogger(__name__)
 
 
+def create_log_listener() -> QueueListener:
+    """Create the listener that writes queued log records to their destinations."""
+    handlers: list[logging.Handler] = [logging.StreamHandler()]
+    if settings.APP_ENV == "production":
+        # Buffer file writes and flush in batches; errors flush immediately.
+        # One file per worker process: rotation is not safe across processes.
+        handlers.append(
+            MemoryHandler(
+                capacity=1000,
+                flushLevel=logging.ERROR,
+                target=RotatingFileHandler(f"app.{os.getpid()}.log", maxBytes=10 * 1024 * 1024, backupCount=10),
+            )
+        )
+    formatter = logging.Formatter(LOG_FORMAT)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    return QueueListener(log_queue, *handlers)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
+    app.state.log_listener = create_log_listener()
+    app.state.log_listener.start()
+
     logger.info("Starting Antikythera F1 Video Generator")
     logger.info(f"Environment: {settings.APP_ENV}")
     logger.info(f"Debug mode: {settings.DEBUG}")
     
     # Startup
+    # Routes are all async def; the AnyIO threadpool only runs sync work such as
+    # UploadFile I/O. Size it to the DB pool so it never caps concurrency first.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW
+    )
+
     logger.info("Initializing database connection...")
+    try:
+        await warm_pool()
+    except Exception as e:
+        logger.warning(f"Database pool warm-up failed: {e}")
     
     yield
     
     # Shutdown
     logger.info("Shutting down...")
+    await close_http_client()
     await engine.dispose()
+    app.state.log_listener.stop()
+    for handler in app.state.log_listener.handlers:
+        # MemoryHandler.close() flushes to its file handler but drops it unclosed
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
 
 
 app = FastAPI(
@@ -53,10 +118,11 @@ app = FastAPI(
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure properly for production
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    expose_headers=["ETag", NEXT_CURSOR_HEADER],
 )
 
 # Include routers
@@ -1,11 +1,16 @@
-"""SQLAlchemy models."""
+"""SQLAlchemy models.
+
+Relationships are loaded explicitly at the query site (``selectinload`` plus
+``raiseload("*")``); lazy loads cannot run under AsyncSession. Log and API
+usage collections are ``lazy="raise"`` and only ever queried directly.
+"""
 
 from app.database import Base
 from app.models.character import Character, CharacterImage
 from app.models.race import Race
 from app.models.episode import Episode, EpisodeType, EpisodeStatus
 from app.models.scene import Scene, SceneStatus
-from app.models.logs import GenerationLog, LogLevel, LogComponent, APIUsage, APIProvider, CleanupLog
+from app.models.logs import GenerationLog, LogLevel, LogComponent, APIUsage, APIUsageDaily, APIProvider, CleanupLog
 from app.models.scheduler import ScheduledJob, JobStatus, JobTriggerType
 from app.models.news import NewsSource, NewsArticle, ArticleContext, EpisodeStoryline
 from app.models.gag import RunningGag, GagUsage, GagStatus, GagCategory
@@ -24,6 +29,7 @@ __all__ = [
     "LogLevel",
     "LogComponent",
     "APIUsage",
+    "APIUsageDaily",
     "APIProvider",
     "CleanupLog",
     # Scheduler
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -22,8 +22,8 @@ class Character(Base):
     personality: Mapped[Optional[str]] = mapped_column(Text)
     primary_image_path: Mapped[Optional[str]] = mapped_column(String(500))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Caricature traits for satirical image generation
     role: Mapped[Optional[str]] = mapped_column(String(50))
@@ -59,12 +59,21 @@ class CharacterImage(Base):
     pose_description: Mapped[Optional[str]] = mapped_column(String(255))
     is_primary: Mapped[bool] = mapped_column(Boolean, default=False)
     is_style_reference: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     character: Mapped["Character"] = relationship("Character", back_populates="images")
     scenes: Mapped[List["Scene"]] = relationship("Scene", back_populates="character_image")
 
+    __table_args__ = (
+        Index(
+            "uq_character_images_primary",
+            "character_id",
+            unique=True,
+            postgresql_where=text("is_primary"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<CharacterImage {self.id} for Character {self.character_id}>"
 
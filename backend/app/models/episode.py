@@ -5,10 +5,10 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, Numeric, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, enum_values
 
 
 class EpisodeType(str, enum.Enum):
@@ -38,18 +38,18 @@ class Episode(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     race_id: Mapped[Optional[int]] = mapped_column(ForeignKey("races.id"))
     episode_type: Mapped[EpisodeType] = mapped_column(
-        Enum(EpisodeType, name="episode_type", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        Enum(EpisodeType, name="episode_type", create_type=False, values_callable=enum_values),
         nullable=False,
     )
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
     status: Mapped[EpisodeStatus] = mapped_column(
-        Enum(EpisodeStatus, name="episode_status", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        Enum(EpisodeStatus, name="episode_status", create_type=False, values_callable=enum_values),
         default=EpisodeStatus.PENDING,
     )
 
     # Timing
-    triggered_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    triggered_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     generation_started_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     generation_completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     upload_started_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
@@ -75,14 +75,30 @@ class Episode(Base):
     retry_count: Mapped[int] = mapped_column(Integer, default=0)
     last_error: Mapped[Optional[str]] = mapped_column(Text)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     race: Mapped[Optional["Race"]] = relationship("Race", back_populates="episodes")
     scenes: Mapped[List["Scene"]] = relationship("Scene", back_populates="episode", cascade="all, delete-orphan")
-    logs: Mapped[List["GenerationLog"]] = relationship("GenerationLog", back_populates="episode", cascade="all, delete-orphan")
-    api_usage: Mapped[List["APIUsage"]] = relationship("APIUsage", back_populates="episode", cascade="all, delete-orphan")
+    # Unbounded, write-mostly children: never loaded implicitly, and deletes
+    # rely on ON DELETE CASCADE instead of loading them
+    logs: Mapped[List["GenerationLog"]] = relationship(
+        "GenerationLog", back_populates="episode", cascade="all, delete-orphan", lazy="raise", passive_deletes=True
+    )
+    api_usage: Mapped[List["APIUsage"]] = relationship(
+        "APIUsage", back_populates="episode", cascade="all, delete-orphan", lazy="raise", passive_deletes=True
+    )
+
+    __table_args__ = (
+        Index(
+            "idx_episodes_created_status",
+            "created_at",
+            "status",
+            postgresql_include=["generation_time_seconds", "scene_count", "total_cost_usd"],
+        ),
+        Index("idx_episodes_race_status", "race_id", "status"),
+    )
 
     def __repr__(self) -> str:
         return f"<Episode {self.id}: {self.title}>"
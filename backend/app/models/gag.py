@@ -4,11 +4,11 @@ import enum
 from datetime import date, datetime
 from typing import List, Optional
 
-from sqlalchemy import Boolean, Date, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Date, DateTime, Enum, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, enum_values
 
 
 class GagStatus(str, enum.Enum):
@@ -32,6 +32,22 @@ class RunningGag(Base):
     """Running jokes and character gags that carry across races."""
 
     __tablename__ = "running_gags"
+    __table_args__ = (
+        Index(
+            "idx_running_gags_active_humor",
+            "is_active",
+            text("humor_rating DESC"),
+            text("created_at DESC"),
+        ),
+        Index(
+            "idx_running_gags_available",
+            "status",
+            text("humor_rating DESC"),
+            postgresql_where=text("is_active"),
+        ),
+        Index("uq_running_gags_active_title", "title", unique=True, postgresql_where=text("is_active")),
+        Index("idx_running_gags_tags", "tags", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -39,7 +55,7 @@ class RunningGag(Base):
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     category: Mapped[GagCategory] = mapped_column(
-        Enum(GagCategory, name="gag_category", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        Enum(GagCategory, name="gag_category", create_type=False, values_callable=enum_values),
         default=GagCategory.RUNNING_JOKE,
     )
 
@@ -61,7 +77,7 @@ class RunningGag(Base):
 
     # Usage tracking
     status: Mapped[GagStatus] = mapped_column(
-        Enum(GagStatus, name="gag_status", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        Enum(GagStatus, name="gag_status", create_type=False, values_callable=enum_values),
         default=GagStatus.ACTIVE,
     )
     times_used: Mapped[int] = mapped_column(Integer, default=0)
@@ -78,8 +94,8 @@ class RunningGag(Base):
     # Metadata
     tags: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     primary_character: Mapped[Optional["Character"]] = relationship(
@@ -114,7 +130,7 @@ class GagUsage(Base):
     dialogue_excerpt: Mapped[Optional[str]] = mapped_column(Text)
     effectiveness_rating: Mapped[Optional[int]] = mapped_column(Integer)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     gag: Mapped["RunningGag"] = relationship("RunningGag", back_populates="usages")
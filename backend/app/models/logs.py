@@ -1,15 +1,15 @@
 """Logging and tracking models."""
 
 import enum
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Optional
 
-from sqlalchemy import BigInteger, DateTime, Enum, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import BigInteger, Date, DateTime, Enum, ForeignKey, Index, Integer, Numeric, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, enum_values
 
 
 class LogLevel(str, enum.Enum):
@@ -49,22 +49,27 @@ class GenerationLog(Base):
     scene_id: Mapped[Optional[int]] = mapped_column(ForeignKey("scenes.id", ondelete="CASCADE"))
 
     level: Mapped[LogLevel] = mapped_column(
-        Enum(LogLevel, name="log_level", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        Enum(LogLevel, name="log_level", create_type=False, values_callable=enum_values),
         nullable=False,
     )
     component: Mapped[LogComponent] = mapped_column(
-        Enum(LogComponent, name="log_component", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        Enum(LogComponent, name="log_component", create_type=False, values_callable=enum_values),
         nullable=False,
     )
     message: Mapped[str] = mapped_column(Text, nullable=False)
-    details: Mapped[Optional[dict[str, Any]]] = mapped_column(JSONB)
+    details: Mapped[Optional[dict[str, Any]]] = mapped_column(JSONB, deferred=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     episode: Mapped[Optional["Episode"]] = relationship("Episode", back_populates="logs")
     scene: Mapped[Optional["Scene"]] = relationship("Scene", back_populates="logs")
 
+    __table_args__ = (
+        Index("idx_logs_episode_created", "episode_id", text("created_at DESC")),
+        Index("idx_logs_details", "details", postgresql_using="gin"),
+    )
+
     def __repr__(self) -> str:
         return f"<GenerationLog {self.level.value}: {self.message[:50]}>"
 
@@ -79,7 +84,7 @@ class APIUsage(Base):
     scene_id: Mapped[Optional[int]] = mapped_column(ForeignKey("scenes.id", ondelete="CASCADE"))
 
     provider: Mapped[APIProvider] = mapped_column(
-        Enum(APIProvider, name="api_provider", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        Enum(APIProvider, name="api_provider", create_type=False, values_callable=enum_values),
         nullable=False,
     )
     endpoint: Mapped[Optional[str]] = mapped_column(String(255))
@@ -96,16 +101,49 @@ class APIUsage(Base):
     output_tokens: Mapped[Optional[int]] = mapped_column(Integer)
     cost_usd: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 6))
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     episode: Mapped[Optional["Episode"]] = relationship("Episode", back_populates="api_usage")
     scene: Mapped[Optional["Scene"]] = relationship("Scene", back_populates="api_usage")
 
+    __table_args__ = (
+        Index(
+            "idx_api_usage_created_provider",
+            "created_at",
+            "provider",
+            postgresql_include=["cost_usd", "input_tokens", "output_tokens", "response_time_ms"],
+        ),
+        Index("idx_api_usage_episode_provider", "episode_id", "provider"),
+    )
+
     def __repr__(self) -> str:
         return f"<APIUsage {self.provider.value} - {self.endpoint}>"
 
 
+class APIUsageDaily(Base):
+    """Daily per-provider rollup of API usage for cost analytics."""
+    
+    __tablename__ = "api_usage_daily"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    provider: Mapped[APIProvider] = mapped_column(
+        Enum(APIProvider, name="api_provider", create_type=False, values_callable=enum_values),
+        primary_key=True,
+    )
+
+    api_calls: Mapped[int] = mapped_column(Integer, default=0)
+    cost_usd: Mapped[Decimal] = mapped_column(Numeric(12, 6), default=0)
+    input_tokens: Mapped[int] = mapped_column(BigInteger, default=0)
+    output_tokens: Mapped[int] = mapped_column(BigInteger, default=0)
+    avg_response_time_ms: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 2))
+
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<APIUsageDaily {self.day} {self.provider.value}: {self.api_calls} calls>"
+
+
 class CleanupLog(Base):
     """Storage cleanup audit trail."""
     
@@ -122,7 +160,7 @@ class CleanupLog(Base):
     started_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     def __repr__(self) -> str:
         return f"<CleanupLog {self.id}: {self.files_deleted} files>"
@@ -1,15 +1,21 @@
 """News scraping models."""
 
 import enum
+import hashlib
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, LargeBinary, Numeric, String, Text, func, text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
-from app.database import Base
+from app.database import Base, enum_values
+
+
+def url_digest(url: str) -> bytes:
+    """MD5 digest of an article URL; matches ``decode(md5(url), 'hex')`` in SQL."""
+    return hashlib.md5(url.encode()).digest()
 
 
 class ArticleContext(str, enum.Enum):
@@ -33,7 +39,7 @@ class NewsSource(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     priority: Mapped[int] = mapped_column(Integer, default=5)  # 1-10
     last_scraped_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     articles: Mapped[List["NewsArticle"]] = relationship("NewsArticle", back_populates="source")
@@ -46,41 +52,59 @@ class NewsArticle(Base):
     """Cached news articles for content generation."""
     
     __tablename__ = "news_articles"
+    __table_args__ = (
+        Index("uq_news_articles_url_hash", "url_hash", unique=True),
+        Index("idx_news_articles_scraped_id", text("scraped_at DESC"), text("id DESC")),
+        Index("idx_news_articles_unprocessed", "context", postgresql_where=text("NOT is_processed")),
+        Index("idx_news_articles_keywords", "keywords", postgresql_using="gin"),
+        Index("idx_news_articles_drivers", "mentioned_drivers", postgresql_using="gin"),
+        Index("idx_news_articles_teams", "mentioned_teams", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     source_id: Mapped[Optional[int]] = mapped_column(ForeignKey("news_sources.id"))
     
     # Article content
     title: Mapped[str] = mapped_column(String(500), nullable=False)
-    url: Mapped[str] = mapped_column(String(1000), unique=True, nullable=False)
+    url: Mapped[str] = mapped_column(String(1000), nullable=False)
+    # Uniqueness is enforced on the 16-byte digest rather than the full URL
+    url_hash: Mapped[bytes] = mapped_column(LargeBinary(16), nullable=False)
     summary: Mapped[Optional[str]] = mapped_column(Text)
-    full_content: Mapped[Optional[str]] = mapped_column(Text)
+    # Large text/array columns are deferred as one group; load them with
+    # undefer_group("heavy") where the full article is returned
+    full_content: Mapped[Optional[str]] = mapped_column(Text, deferred=True, deferred_group="heavy")
     
     # Categorization
     context: Mapped[ArticleContext] = mapped_column(
-        Enum(ArticleContext, name="article_context", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        Enum(ArticleContext, name="article_context", create_type=False, values_callable=enum_values),
         default=ArticleContext.RACE_WEEKEND,
     )
-    keywords: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text))
-    mentioned_drivers: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text))
-    mentioned_teams: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text))
+    keywords: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text), deferred=True, deferred_group="heavy")
+    mentioned_drivers: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text), deferred=True, deferred_group="heavy")
+    mentioned_teams: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text), deferred=True, deferred_group="heavy")
     sentiment_score: Mapped[Optional[Decimal]] = mapped_column(Numeric(3, 2))  # -1 to 1
     
     # Usage tracking
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
-    scraped_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    scraped_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     used_in_episode_id: Mapped[Optional[int]] = mapped_column(ForeignKey("episodes.id"))
     used_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     
     # Processing
     is_processed: Mapped[bool] = mapped_column(Boolean, default=False)
     processing_error: Mapped[Optional[str]] = mapped_column(Text)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     source: Mapped[Optional["NewsSource"]] = relationship("NewsSource", back_populates="articles")
     episode: Mapped[Optional["Episode"]] = relationship("Episode", backref="news_articles")
 
+    @validates("url")
+    def _set_url_hash(self, key: str, url: str) -> str:
+        self.url_hash = url_digest(url)
+        return url
+
     def __repr__(self) -> str:
         return f"<NewsArticle {self.id}: {self.title[:50]}...>"
 
@@ -89,6 +113,9 @@ class EpisodeStoryline(Base):
     """Storyline development and source tracking per episode."""
     
     __tablename__ = "episode_storylines"
+    __table_args__ = (
+        Index("idx_episode_storylines_key_facts", "key_facts", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     episode_id: Mapped[int] = mapped_column(ForeignKey("episodes.id", ondelete="CASCADE"), nullable=False)
@@ -100,14 +127,14 @@ class EpisodeStoryline(Base):
     
     # Source material
     news_article_ids: Mapped[Optional[List[int]]] = mapped_column(ARRAY(Integer))
-    key_facts: Mapped[Optional[dict]] = mapped_column(JSONB)
+    key_facts: Mapped[Optional[dict]] = mapped_column(JSONB, deferred=True)
     
     # Generation tracking
     prompt_used: Mapped[Optional[str]] = mapped_column(Text)
     model_used: Mapped[Optional[str]] = mapped_column(String(100))
     tokens_used: Mapped[Optional[int]] = mapped_column(Integer)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     episode: Mapped["Episode"] = relationship("Episode", backref="storyline")
@@ -3,7 +3,7 @@
 from datetime import date, datetime
 from typing import List, Optional
 
-from sqlalchemy import Boolean, Date, DateTime, Integer, String, UniqueConstraint
+from sqlalchemy import Boolean, Date, DateTime, Integer, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -32,7 +32,7 @@ class Race(Base):
     sprint_qualifying_datetime: Mapped[Optional[datetime]] = mapped_column(DateTime)
     sprint_race_datetime: Mapped[Optional[datetime]] = mapped_column(DateTime)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     episodes: Mapped[List["Episode"]] = relationship("Episode", back_populates="race")
@@ -5,10 +5,10 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, Numeric, String, Text, UniqueConstraint
+from sqlalchemy import DateTime, Enum, ForeignKey, Integer, Numeric, String, Text, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, enum_values
 
 
 class SceneStatus(str, enum.Enum):
@@ -44,7 +44,7 @@ class Scene(Base):
 
     # Output
     status: Mapped[SceneStatus] = mapped_column(
-        Enum(SceneStatus, name="scene_status", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        Enum(SceneStatus, name="scene_status", create_type=False, values_callable=enum_values),
         default=SceneStatus.PENDING,
     )
     source_image_path: Mapped[Optional[str]] = mapped_column(String(500))
@@ -60,14 +60,18 @@ class Scene(Base):
     retry_count: Mapped[int] = mapped_column(Integer, default=0)
     last_error: Mapped[Optional[str]] = mapped_column(Text)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     episode: Mapped["Episode"] = relationship("Episode", back_populates="scenes")
     character: Mapped[Optional["Character"]] = relationship("Character", back_populates="scenes")
     character_image: Mapped[Optional["CharacterImage"]] = relationship("CharacterImage", back_populates="scenes")
-    logs: Mapped[list["GenerationLog"]] = relationship("GenerationLog", back_populates="scene", cascade="all, delete-orphan")
-    api_usage: Mapped[list["APIUsage"]] = relationship("APIUsage", back_populates="scene", cascade="all, delete-orphan")
+    logs: Mapped[list["GenerationLog"]] = relationship(
+        "GenerationLog", back_populates="scene", cascade="all, delete-orphan", lazy="raise", passive_deletes=True
+    )
+    api_usage: Mapped[list["APIUsage"]] = relationship(
+        "APIUsage", back_populates="scene", cascade="all, delete-orphan", lazy="raise", passive_deletes=True
+    )
 
     __table_args__ = (
         UniqueConstraint("episode_id", "scene_number", name="uq_scene_episode_number"),
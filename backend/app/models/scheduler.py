@@ -4,11 +4,11 @@ import enum
 from datetime import datetime
 from typing import Any, Optional
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, enum_values
 
 
 class JobStatus(str, enum.Enum):
@@ -33,13 +33,17 @@ class ScheduledJob(Base):
     """Scheduled video generation jobs with trigger timing."""
     
     __tablename__ = "scheduled_jobs"
+    __table_args__ = (
+        Index("idx_scheduled_jobs_scheduled_id", text("scheduled_for DESC"), text("id DESC")),
+        Index("idx_scheduled_jobs_due", "scheduled_for", postgresql_where=text("status = 'scheduled'")),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     race_id: Mapped[Optional[int]] = mapped_column(ForeignKey("races.id"))
     
     # Job configuration
     trigger_type: Mapped[JobTriggerType] = mapped_column(
-        Enum(JobTriggerType, name="job_trigger_type", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        Enum(JobTriggerType, name="job_trigger_type", create_type=False, values_callable=enum_values),
         nullable=False,
     )
     scheduled_for: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -47,7 +51,7 @@ class ScheduledJob(Base):
     
     # Execution tracking
     status: Mapped[JobStatus] = mapped_column(
-        Enum(JobStatus, name="job_status", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        Enum(JobStatus, name="job_status", create_type=False, values_callable=enum_values),
         default=JobStatus.SCHEDULED,
     )
     started_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
@@ -61,8 +65,8 @@ class ScheduledJob(Base):
     
     # Metadata
     scrape_context: Mapped[Optional[dict[str, Any]]] = mapped_column(JSONB)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     race: Mapped[Optional["Race"]] = relationship("Race", backref="scheduled_jobs")
@@ -1,5 +1,12 @@
 """Video generation pipeline."""
 
-from app.pipeline.video_pipeline import VideoPipeline
-
 __all__ = ["VideoPipeline"]
+
+
+def __getattr__(name: str):
+    # Defer the generation stack (model clients, image libs) until it is used
+    if name == "VideoPipeline":
+        from app.pipeline.video_pipeline import VideoPipeline
+
+        return VideoPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,155 @@
+"""Task queue entry points for the video pipeline.
+
+Pipelines run on dedicated RQ workers (``python -m app.worker``) rather
+than in the API process, so they survive API restarts and scale with
+worker replicas. The workers also run the periodic API usage rollup.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, timezone
+
+from redis import Redis
+from rq import Callback, Queue
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_queue: Queue | None = None
+
+
+def get_pipeline_queue() -> Queue:
+    """Get the shared pipeline queue, connecting to Redis on first use."""
+    global _queue
+    if _queue is None:
+        _queue = Queue(
+            settings.PIPELINE_QUEUE_NAME,
+            connection=Redis.from_url(settings.REDIS_URL),
+        )
+    return _queue
+
+
+async def enqueue_pipeline(episode_id: int, attempt: int = 0) -> str:
+    """
+    Enqueue a pipeline run for an episode.
+
+    RQ does not dedupe on job ID (re-enqueueing an ID overwrites the job), so
+    callers must only enqueue an episode they have claimed, and ``attempt``
+    (the episode's retry_count) gives each run its own ID to keep the history
+    of failed runs. If the job dies outside the pipeline's own error
+    handling (timeout, killed work horse), RQ runs ``on_pipeline_failure``.
+
+    Returns:
+        The RQ job ID
+    """
+    job = await asyncio.to_thread(
+        get_pipeline_queue().enqueue,
+        run_pipeline_job,
+        episode_id,
+        job_id=f"episode-{episode_id}-{attempt}",
+        job_timeout=settings.PIPELINE_JOB_TIMEOUT_SECONDS,
+        on_failure=Callback(on_pipeline_failure),
+    )
+    logger.info(f"Enqueued pipeline for episode {episode_id}: job {job.id}")
+    return job.id
+
+
+def run_pipeline_job(episode_id: int) -> str:
+    """RQ job: run the full video pipeline for an episode."""
+    return asyncio.run(_run_pipeline(episode_id))
+
+
+async def _run_pipeline(episode_id: int) -> str:
+    """Run the pipeline on a fresh event loop and release DB connections afterwards."""
+    from app.database import engine
+    from app.pipeline.video_pipeline import VideoPipeline
+
+    logger.info(f"Starting pipeline job for episode {episode_id}")
+    try:
+        return await VideoPipeline(episode_id).run()
+    finally:
+        await engine.dispose()
+
+
+def on_pipeline_failure(job, connection, type, value, traceback) -> None:
+    """
+    RQ failure callback: mark the episode FAILED.
+
+    RQ also calls this when it cleans up a job whose work horse crashed,
+    so an episode is never left in an in-progress status without a job.
+    """
+    episode_id = job.args[0]
+    logger.error(f"Pipeline job {job.id} for episode {episode_id} failed: {type.__name__}")
+    asyncio.run(_mark_pipeline_failed(episode_id, f"Pipeline job {job.id} failed: {type.__name__}: {value}"))
+
+
+async def _mark_pipeline_failed(episode_id: int, error: str) -> None:
+    """Fail an episode still in progress (the pipeline may already have recorded its own failure)."""
+    from sqlalchemy import update
+
+    from app.database import async_session_maker, engine
+    from app.models.episode import Episode, EpisodeStatus
+
+    try:
+        async with async_session_maker() as session:
+            await session.execute(
+                update(Episode)
+                .where(
+                    Episode.id == episode_id,
+                    Episode.status.in_(
+                        [
+                            EpisodeStatus.PENDING,
+                            EpisodeStatus.GENERATING,
+                            EpisodeStatus.STITCHING,
+                            EpisodeStatus.UPLOADING,
+                        ]
+                    ),
+                )
+                .values(status=EpisodeStatus.FAILED, last_error=error)
+            )
+            await session.commit()
+    finally:
+        await engine.dispose()
+
+
+def schedule_usage_rollup() -> str:
+    """
+    Schedule the next usage rollup at the next interval boundary.
+
+    The job ID is derived from the boundary, so every worker (and the
+    previous run) scheduling the same slot overwrites one job instead of
+    stacking duplicates.
+
+    Returns:
+        The RQ job ID
+    """
+    interval = settings.USAGE_ROLLUP_INTERVAL_SECONDS
+    slot = (int(datetime.now(timezone.utc).timestamp()) // interval + 1) * interval
+    job = get_pipeline_queue().enqueue_at(
+        datetime.fromtimestamp(slot, timezone.utc),
+        run_usage_rollup_job,
+        job_id=f"usage-rollup-{slot}",
+    )
+    return job.id
+
+
+def run_usage_rollup_job() -> None:
+    """RQ job: refresh the daily API usage rollup, then schedule the next run."""
+    try:
+        asyncio.run(_run_usage_rollup())
+    finally:
+        schedule_usage_rollup()
+
+
+async def _run_usage_rollup() -> None:
+    """Refresh the rollup on a fresh event loop and release DB connections afterwards."""
+    from app.database import async_session_maker, engine
+    from app.services.usage_rollup import UsageRollupService
+
+    try:
+        async with async_session_maker() as session:
+            await UsageRollupService(session).refresh(until=date.today())
+            await session.commit()
+    finally:
+        await engine.dispose()
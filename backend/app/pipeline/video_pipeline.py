@@ -1,13 +1,15 @@
 """Main video generation pipeline."""
 
+import asyncio
 import logging
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, load_only, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.config import settings
 from app.database import async_session_maker
@@ -23,13 +25,14 @@ from app.services.video_generator import VideoGenerator
 from app.services.ovi_space_manager import OviSpaceManager
 from app.services.stitcher import VideoStitcher
 from app.services.youtube_uploader import YouTubeUploader
-from app.services.storage import StorageService
+from app.services.storage import get_storage
 
 
 class VideoPipeline:
     """Main video generation pipeline orchestrator."""
 
     MAX_SCENE_RETRIES = 3
+    MAX_PARALLEL_DOWNLOADS = 8
 
     def __init__(self, episode_id: int):
         self.episode_id = episode_id
@@ -41,11 +44,15 @@ class VideoPipeline:
         self.video_generator = VideoGenerator(quality=settings.OVI_QUALITY)
         self.stitcher = VideoStitcher()
         self.uploader = YouTubeUploader()
-        self.storage = StorageService()
+        self.storage = get_storage()
 
         # State
         self.episode: Optional[Episode] = None
         self.race: Optional[Race] = None
+        self.characters: dict[int, Character] = {}
+        self.style_refs: List[CharacterImage] = []
+        self._image_cache: dict[str, asyncio.Task[str]] = {}  # storage path -> download of the local path
+        self._pending_usage: List[dict] = []  # APIUsage rows, inserted at the end of the run
 
     async def run(self) -> str:
         """
@@ -67,10 +74,11 @@ class VideoPipeline:
                 self.logger.info("PHASE 1: Script Generation")
                 await self._update_status(db, EpisodeStatus.GENERATING)
                 scenes = await self._generate_script(db)
+                await db.commit()
 
                 # Phase 2: Generate video clips
                 self.logger.info("PHASE 2: Video Clip Generation")
-                await self._generate_video_clips(db, scenes)
+                await self._generate_video_clips(scenes)
 
                 # Phase 3: Stitch final video
                 self.logger.info("PHASE 3: Video Stitching")
@@ -87,11 +95,10 @@ class VideoPipeline:
                 await self._cleanup_old_assets(db)
 
                 # Mark as published
-                await self._update_status(db, EpisodeStatus.PUBLISHED)
                 self.episode.published_at = datetime.utcnow()
                 self.episode.youtube_url = youtube_url
-
-                await db.commit()
+                await self._flush_api_usage(db)
+                await self._update_status(db, EpisodeStatus.PUBLISHED)
 
                 self.logger.info("=" * 60)
                 self.logger.info(f"PIPELINE COMPLETE: {youtube_url}")
@@ -106,13 +113,22 @@ class VideoPipeline:
 
     async def _load_episode(self, db: AsyncSession) -> None:
         """Load episode and race from database."""
+        # One round trip: race and (at most VIDEO_SCENE_COUNT) scenes are joined in
         stmt = (
             select(Episode)
-            .options(selectinload(Episode.race), selectinload(Episode.scenes))
+            .outerjoin(Episode.race)
+            .outerjoin(Episode.scenes)
+            .options(
+                contains_eager(Episode.race),
+                # Script text columns are not read from existing scenes
+                contains_eager(Episode.scenes).load_only(Scene.id, Scene.scene_number, Scene.status),
+                raiseload("*"),
+            )
             .where(Episode.id == self.episode_id)
+            .order_by(Scene.scene_number)
         )
         result = await db.execute(stmt)
-        self.episode = result.scalar_one_or_none()
+        self.episode = result.unique().scalar_one_or_none()
 
         if not self.episode:
             raise ValueError(f"Episode {self.episode_id} not found")
@@ -120,22 +136,36 @@ class VideoPipeline:
         self.race = self.episode.race
         self.episode.generation_started_at = datetime.utcnow()
 
+        # Loaded once; the script and every scene image read from these
+        result = await db.execute(
+            select(Character).options(raiseload("*")).where(Character.is_active == True)
+        )
+        self.characters = {c.id: c for c in result.scalars().all()}
+
+        result = await db.execute(
+            select(CharacterImage)
+            .options(raiseload("*"))
+            .where(CharacterImage.is_style_reference == True)
+            .limit(settings.GEMINI_STYLE_REFERENCE_COUNT)
+        )
+        self.style_refs = list(result.scalars().all())
+
         self.logger.info(f"Loaded episode: {self.episode.title}")
         if self.race:
             self.logger.info(f"Race: {self.race.race_name}")
 
     async def _update_status(self, db: AsyncSession, status: EpisodeStatus) -> None:
-        """Update episode status."""
+        """Update episode status and commit it."""
         self.episode.status = status
-        await db.flush()
+        # Each phase runs in its own transaction: committing here releases the
+        # episode row lock instead of holding it through script generation,
+        # stitching and upload (expire_on_commit=False keeps self.episode loaded)
+        await db.commit()
         self.logger.info(f"Status updated to: {status.value}")
 
     async def _generate_script(self, db: AsyncSession) -> List[Scene]:
         """Generate script and create scene records."""
-        # Get available characters
-        stmt = select(Character).where(Character.is_active == True)
-        result = await db.execute(stmt)
-        characters = result.scalars().all()
+        characters = list(self.characters.values())
 
         character_data = [
             {
@@ -160,10 +190,11 @@ class VideoPipeline:
         self.episode.title = script.title
         self.episode.anthropic_tokens_used = script.input_tokens + script.output_tokens
         self.episode.anthropic_cost_usd = Decimal(str(script.cost_usd))
+        # The script is the only billed call (Ovi is free), so it is the total
+        self.episode.total_cost_usd = self.episode.anthropic_cost_usd
 
         # Log API usage
-        await self._log_api_usage(
-            db,
+        self._log_api_usage(
             provider=APIProvider.ANTHROPIC,
             endpoint="/messages",
             input_tokens=script.input_tokens,
@@ -171,28 +202,26 @@ class VideoPipeline:
             cost_usd=script.cost_usd,
         )
 
-        # Create scene records
-        scenes = []
-        for scene_script in script.scenes:
-            # Find character
-            character = next(
-                (c for c in characters if c.name == scene_script.character),
-                None,
-            )
-
-            scene = Scene(
-                episode_id=self.episode_id,
-                scene_number=scene_script.scene_number,
-                character_id=character.id if character else None,
-                dialogue=scene_script.dialogue,
-                action_description=scene_script.action,
-                audio_description=scene_script.audio_description,
-                status=SceneStatus.PENDING,
-            )
-            db.add(scene)
-            scenes.append(scene)
+        # Create scene records in one multi-row INSERT; RETURNING hands back
+        # the Scene instances (in script order) for the clip phase
+        character_ids = {c.name: c.id for c in characters}
+        rows = [
+            {
+                "episode_id": self.episode_id,
+                "scene_number": scene_script.scene_number,
+                "character_id": character_ids.get(scene_script.character),
+                "dialogue": scene_script.dialogue,
+                "action_description": scene_script.action,
+                "audio_description": scene_script.audio_description,
+                "status": SceneStatus.PENDING,
+            }
+            for scene_script in script.scenes
+        ]
 
-        await db.flush()
+        # scene_count starts as the planned total; record what the script produced
+        self.episode.scene_count = len(rows)
+        result = await db.scalars(insert(Scene).returning(Scene, sort_by_parameter_order=True), rows)
+        scenes = list(result.all())
         self.logger.info(f"Created {len(scenes)} scene records")
 
         return scenes
@@ -209,7 +238,7 @@ Date: {self.race.race_date}
 Season: {self.race.season} Round {self.race.round_number}
 """
 
-    async def _generate_video_clips(self, db: AsyncSession, scenes: List[Scene]) -> None:
+    async def _generate_video_clips(self, scenes: List[Scene]) -> None:
         """
         Generate video clips for all scenes.
         
@@ -221,29 +250,32 @@ Season: {self.race.season} Round {self.race.round_number}
         """
         self.logger.info("Starting Ovi space for video generation...")
         
-        # Use OviSpaceManager for automatic lifecycle management
-        async with OviSpaceManager(quality=settings.OVI_QUALITY) as ovi_manager:
-            for scene in scenes:
+        # Ovi calls are capped at OVI_PARALLELISM; one extra scene slot lets the
+        # next scene's image generate while the GPU renders
+        ovi_slots = asyncio.Semaphore(settings.OVI_PARALLELISM)
+        scene_slots = asyncio.Semaphore(settings.OVI_PARALLELISM + 1)
+
+        async def run_scene(ovi_manager: OviSpaceManager, scene: Scene) -> dict:
+            """Generate one scene; returns the column values it wrote."""
+            async with scene_slots:
                 self.logger.info(f"Processing scene {scene.scene_number}/{len(scenes)}")
+                values = {"generation_started_at": datetime.utcnow()}
 
                 try:
-                    scene.status = SceneStatus.GENERATING
-                    scene.generation_started_at = datetime.utcnow()
-                    await db.flush()
-
                     # Generate scene image with Nano Banana Pro (character consistent)
-                    source_image = await self._get_scene_image(db, scene)
+                    source_image, values["source_image_path"] = await self._get_scene_image(scene)
 
                     # Build Ovi prompt with special tokens
                     prompt = self._build_ovi_prompt(scene)
-                    
+
                     # Generate video clip using OviSpaceManager
-                    start_time = datetime.utcnow()
-                    video_path = await ovi_manager.generate_video(
-                        image_path=source_image,
-                        prompt=prompt,
-                    )
-                    generation_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+                    async with ovi_slots:
+                        start_time = datetime.utcnow()
+                        video_path = await ovi_manager.generate_video(
+                            image_path=source_image,
+                            prompt=prompt,
+                        )
+                        generation_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
 
                     # Upload to storage
                     clip_path = await self.storage.upload_video_clip(
@@ -253,33 +285,55 @@ Season: {self.race.season} Round {self.race.round_number}
                         file_path=video_path,
                     )
 
-                    # Update scene
-                    scene.video_clip_path = clip_path
-                    scene.status = SceneStatus.COMPLETED
-                    scene.generation_completed_at = datetime.utcnow()
-                    scene.generation_time_ms = generation_time_ms
-
-                    self.episode.ovi_calls += 1
-
+                    values.update(
+                        video_clip_path=clip_path,
+                        status=SceneStatus.COMPLETED,
+                        generation_completed_at=datetime.utcnow(),
+                        generation_time_ms=generation_time_ms,
+                    )
                     self.logger.info(f"Scene {scene.scene_number} complete: {generation_time_ms}ms")
 
-                    await db.flush()
-
                 except Exception as e:
                     self.logger.error(f"Scene {scene.scene_number} failed: {e}")
-                    scene.status = SceneStatus.FAILED
-                    scene.last_error = str(e)
-                    scene.retry_count += 1
-                    await db.flush()
-
-                    if scene.retry_count >= self.MAX_SCENE_RETRIES:
-                        raise SceneGenerationError(
-                            scene.scene_number,
-                            f"Failed after {self.MAX_SCENE_RETRIES} retries",
-                        )
+                    values.update(
+                        status=SceneStatus.FAILED,
+                        last_error=str(e),
+                        retry_count=scene.retry_count + 1,
+                    )
+
+                # Tasks never share a session: each scene's terminal state is
+                # written in its own short transaction
+                async with async_session_maker() as scene_db:
+                    await scene_db.execute(update(Scene).where(Scene.id == scene.id).values(**values))
+                    await scene_db.commit()
+                return values
+
+        # Use OviSpaceManager for automatic lifecycle management
+        async with OviSpaceManager(quality=settings.OVI_QUALITY) as ovi_manager:
+            # Let every scene settle before surfacing a failure
+            results = await asyncio.gather(
+                *(run_scene(ovi_manager, scene) for scene in scenes), return_exceptions=True
+            )
         
         # Space is automatically paused after context manager exits
         self.logger.info("Ovi space paused to save GPU costs")
+
+        # Back on the pipeline task: mirror the written values onto the loaded
+        # scenes without marking them dirty in the pipeline's session
+        for scene, result in zip(scenes, results):
+            if isinstance(result, BaseException):
+                raise result
+            for key, value in result.items():
+                set_committed_value(scene, key, value)
+
+        self.episode.ovi_calls += sum(scene.status == SceneStatus.COMPLETED for scene in scenes)
+
+        for scene in scenes:
+            if scene.status == SceneStatus.FAILED and scene.retry_count >= self.MAX_SCENE_RETRIES:
+                raise SceneGenerationError(
+                    scene.scene_number,
+                    f"Failed after {self.MAX_SCENE_RETRIES} retries",
+                )
     
     def _build_ovi_prompt(self, scene: Scene) -> str:
         """
@@ -299,7 +353,7 @@ Season: {self.race.season} Round {self.race.round_number}
         
         return " ".join(parts)
 
-    async def _get_scene_image(self, db: AsyncSession, scene: Scene) -> str:
+    async def _get_scene_image(self, scene: Scene) -> tuple[str, str]:
         """
         Generate scene image using Gemini with character consistency.
 
@@ -307,6 +361,9 @@ Season: {self.race.season} Round {self.race.round_number}
         1. Style reference images fed as multi-modal input to Gemini
         2. Character traits from database (physical features, comedy angle, etc.)
         3. Master style template baked into every prompt
+
+        Returns:
+            (local image path, storage path of the archived image)
         """
         # Get character info
         character_name = "generic_commentator"
@@ -315,9 +372,7 @@ Season: {self.race.season} Round {self.race.round_number}
         style_reference_paths = []
 
         if scene.character_id:
-            stmt = select(Character).where(Character.id == scene.character_id)
-            result = await db.execute(stmt)
-            character = result.scalar_one_or_none()
+            character = self.characters.get(scene.character_id)
 
             if character:
                 character_name = character.name
@@ -338,31 +393,25 @@ Season: {self.race.season} Round {self.race.round_number}
                     "clothing_description": character.clothing_description,
                 }
 
-                # Check for reference image in MinIO
-                if character.primary_image_path:
-                    try:
-                        reference_image_path = await self.storage.download_character_image(
-                            character.primary_image_path
-                        )
-                        self.logger.debug(f"Using reference image: {reference_image_path}")
-                    except Exception as e:
-                        self.logger.warning(f"Could not load reference image: {e}")
-
-                # Load style reference images (gold standard caricatures)
-                style_ref_stmt = (
-                    select(CharacterImage)
-                    .where(CharacterImage.is_style_reference == True)
-                    .limit(settings.GEMINI_STYLE_REFERENCE_COUNT)
+                # Reference image and style references (gold standard caricatures)
+                # from MinIO, fetched together
+                primary, *style_results = await asyncio.gather(
+                    self._download_character_image(character.primary_image_path),
+                    *(self._download_character_image(ref.image_path) for ref in self.style_refs),
+                    return_exceptions=True,
                 )
-                style_result = await db.execute(style_ref_stmt)
-                style_refs = style_result.scalars().all()
 
-                for ref in style_refs:
-                    try:
-                        local_path = await self.storage.download_character_image(ref.image_path)
-                        style_reference_paths.append(local_path)
-                    except Exception as e:
-                        self.logger.warning(f"Could not load style ref {ref.image_path}: {e}")
+                if isinstance(primary, Exception):
+                    self.logger.warning(f"Could not load reference image: {primary}")
+                elif primary:
+                    reference_image_path = primary
+                    self.logger.debug(f"Using reference image: {reference_image_path}")
+
+                for ref, result in zip(self.style_refs, style_results):
+                    if isinstance(result, Exception):
+                        self.logger.warning(f"Could not load style ref {ref.image_path}: {result}")
+                    else:
+                        style_reference_paths.append(result)
 
                 if style_reference_paths:
                     self.logger.info(f"Loaded {len(style_reference_paths)} style references")
@@ -387,20 +436,36 @@ Season: {self.race.season} Round {self.race.round_number}
             file_path=generated.image_path,
         )
         
-        # Update scene record with image path
-        scene.source_image_path = image_storage_path
-        
         self.logger.info(
             f"Scene {scene.scene_number}: Generated image in {generated.generation_time_ms}ms"
         )
         
-        return generated.image_path
+        return generated.image_path, image_storage_path
+
+    async def _download_character_image(self, storage_path: Optional[str]) -> Optional[str]:
+        """Download a character image, once per pipeline run."""
+        if not storage_path:
+            return None
+        # Cache the task, not the result, so concurrent scenes share one download
+        task = self._image_cache.get(storage_path)
+        if task is None:
+            task = asyncio.create_task(self.storage.download_character_image(storage_path))
+            self._image_cache[storage_path] = task
+        try:
+            # Shielded so one cancelled scene does not cancel the others' download
+            return await asyncio.shield(task)
+        except Exception:
+            # Let a later scene retry a failed download
+            if self._image_cache.get(storage_path) is task:
+                del self._image_cache[storage_path]
+            raise
 
     async def _stitch_video(self, db: AsyncSession) -> str:
         """Stitch all scene clips into final video."""
         # Get completed scenes in order
         stmt = (
             select(Scene)
+            .options(load_only(Scene.scene_number, Scene.video_clip_path, Scene.status), raiseload("*"))
             .where(Scene.episode_id == self.episode_id, Scene.status == SceneStatus.COMPLETED)
             .order_by(Scene.scene_number)
         )
@@ -410,13 +475,21 @@ Season: {self.race.season} Round {self.race.round_number}
         if len(scenes) != settings.VIDEO_SCENE_COUNT:
             self.logger.warning(f"Expected {settings.VIDEO_SCENE_COUNT} scenes, got {len(scenes)}")
 
-        # Download clips from storage
-        clip_paths = []
-        for scene in scenes:
-            if scene.video_clip_path:
-                local_path = f"/tmp/videos/episode_{self.episode_id}/clip_{scene.scene_number:02d}.mp4"
-                # TODO: Download from MinIO
-                clip_paths.append(local_path)
+        # Download clips from storage concurrently, in scene order
+        clip_dir = self.stitcher.work_dir / f"episode_{self.episode_id}"
+        clip_dir.mkdir(parents=True, exist_ok=True)
+        download_slots = asyncio.Semaphore(self.MAX_PARALLEL_DOWNLOADS)
+
+        async def download_clip(scene: Scene) -> str:
+            async with download_slots:
+                return await self.storage.download_video_clip(
+                    scene.video_clip_path,
+                    str(clip_dir / f"clip_{scene.scene_number:02d}.mp4"),
+                )
+
+        clip_paths = await asyncio.gather(
+            *(download_clip(scene) for scene in scenes if scene.video_clip_path)
+        )
 
         # Stitch
         result = await self.stitcher.stitch(self.episode_id, clip_paths)
@@ -489,9 +562,8 @@ Season: {self.race.season} Round {self.race.round_number}
 
         self.logger.info(f"Cleanup: {files_deleted} files, {bytes_freed / 1024 / 1024:.2f} MB freed")
 
-    async def _log_api_usage(
+    def _log_api_usage(
         self,
-        db: AsyncSession,
         provider: APIProvider,
         endpoint: str,
         input_tokens: int = 0,
@@ -499,17 +571,25 @@ Season: {self.race.season} Round {self.race.round_number}
         cost_usd: float = 0,
         response_time_ms: int = 0,
     ) -> None:
-        """Log API usage for tracking."""
-        usage = APIUsage(
-            episode_id=self.episode_id,
-            provider=provider,
-            endpoint=endpoint,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost_usd=Decimal(str(cost_usd)),
-            response_time_ms=response_time_ms,
+        """Record API usage for tracking; written by ``_flush_api_usage``."""
+        self._pending_usage.append(
+            {
+                "episode_id": self.episode_id,
+                "provider": provider,
+                "endpoint": endpoint,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cost_usd": Decimal(str(cost_usd)),
+                "response_time_ms": response_time_ms,
+            }
         )
-        db.add(usage)
+
+    async def _flush_api_usage(self, db: AsyncSession) -> None:
+        """Insert the buffered API usage rows in one statement."""
+        if not self._pending_usage:
+            return
+        await db.execute(insert(APIUsage), self._pending_usage)
+        self._pending_usage = []
 
     async def _handle_failure(self, db: AsyncSession, error: Exception) -> None:
         """Handle pipeline failure."""
@@ -517,13 +597,16 @@ Season: {self.race.season} Round {self.race.round_number}
         self.episode.last_error = str(error)
         self.episode.retry_count += 1
 
-        log = GenerationLog(
-            episode_id=self.episode_id,
-            level=LogLevel.ERROR,
-            component=LogComponent.VIDEO,
-            message=f"Pipeline failed: {error}",
-            details={"error_type": type(error).__name__},
+        # Core INSERTs go out with the status update in the final commit
+        await self._flush_api_usage(db)
+        await db.execute(
+            insert(GenerationLog).values(
+                episode_id=self.episode_id,
+                level=LogLevel.ERROR,
+                component=LogComponent.VIDEO,
+                message=f"Pipeline failed: {error}",
+                details={"error_type": type(error).__name__},
+            )
         )
-        db.add(log)
 
         await db.commit()
@@ -32,6 +32,7 @@ from app.schemas.news import (
     NewsSourceCreate,
     NewsSourceResponse,
     NewsArticleResponse,
+    NewsArticleSummary,
     NewsArticleWithSource,
     EpisodeStorylineCreate,
     EpisodeStorylineResponse,
@@ -73,6 +74,7 @@ __all__ = [
     "NewsSourceCreate",
     "NewsSourceResponse",
     "NewsArticleResponse",
+    "NewsArticleSummary",
     "NewsArticleWithSource",
     "EpisodeStorylineCreate",
     "EpisodeStorylineResponse",
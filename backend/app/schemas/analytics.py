@@ -1,6 +1,5 @@
 """Analytics schemas."""
 
-from decimal import Decimal
 from typing import Optional
 
 from pydantic import BaseModel
@@ -8,16 +7,16 @@ from pydantic import BaseModel
 
 class CostBreakdown(BaseModel):
     """Cost breakdown by provider."""
-    anthropic: Decimal
-    ovi: Decimal
-    youtube: Decimal
-    storage: Decimal
+    anthropic: float
+    ovi: float
+    youtube: float
+    storage: float
 
 
 class CostAnalytics(BaseModel):
     """Cost analytics response."""
     period: str
-    total_cost_usd: Decimal
+    total_cost_usd: float
     breakdown: CostBreakdown
     episodes_generated: int
     total_tokens: int
@@ -31,7 +30,7 @@ class PerformanceMetrics(BaseModel):
     success_rate: float
     avg_generation_time_minutes: Optional[float]
     avg_scenes_per_episode: float
-    avg_cost_per_episode_usd: Decimal
+    avg_cost_per_episode_usd: float
 
 
 class DailyCostSummary(BaseModel):
@@ -39,7 +38,7 @@ class DailyCostSummary(BaseModel):
     date: str
     provider: str
     api_calls: int
-    total_cost_usd: Decimal
+    total_cost_usd: float
     total_input_tokens: int
     total_output_tokens: int
     avg_response_time_ms: float
@@ -1,7 +1,6 @@
 """Episode schemas."""
 
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
@@ -53,7 +52,7 @@ class EpisodeResponse(BaseModel):
     title: str
     status: EpisodeStatus
     youtube_url: Optional[str]
-    total_cost_usd: Decimal
+    total_cost_usd: float
     created_at: datetime
     published_at: Optional[datetime]
 
@@ -87,9 +86,9 @@ class EpisodeDetailResponse(BaseModel):
 
     # Costs
     anthropic_tokens_used: int
-    anthropic_cost_usd: Decimal
+    anthropic_cost_usd: float
     ovi_calls: int
-    total_cost_usd: Decimal
+    total_cost_usd: float
 
     # Scenes
     scenes: list[SceneResponse] = []
@@ -90,4 +90,8 @@ class GagResponse(GagBase):
     is_active: bool
     created_at: datetime
     updated_at: datetime
+
+
+class GagDetailResponse(GagResponse):
+    """Schema for a single gag including its usage history."""
     usages: list[GagUsageResponse] = []
@@ -1,7 +1,6 @@
 """News schemas for API."""
 
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
@@ -46,17 +45,13 @@ class NewsArticleCreate(NewsArticleBase):
     source_id: Optional[int] = None
 
 
-class NewsArticleResponse(NewsArticleBase):
-    """Schema for news article response."""
+class NewsArticleSummary(NewsArticleBase):
+    """Schema for news article listings (no deferred "heavy" columns)."""
     model_config = ConfigDict(from_attributes=True)
     
     id: int
     source_id: Optional[int]
-    full_content: Optional[str]
-    keywords: Optional[list[str]]
-    mentioned_drivers: Optional[list[str]]
-    mentioned_teams: Optional[list[str]]
-    sentiment_score: Optional[Decimal]
+    sentiment_score: Optional[float]
     published_at: Optional[datetime]
     scraped_at: datetime
     used_in_episode_id: Optional[int]
@@ -65,6 +60,14 @@ class NewsArticleResponse(NewsArticleBase):
     created_at: datetime
 
 
+class NewsArticleResponse(NewsArticleSummary):
+    """Schema for news article response."""
+    full_content: Optional[str]
+    keywords: Optional[list[str]]
+    mentioned_drivers: Optional[list[str]]
+    mentioned_teams: Optional[list[str]]
+
+
 class NewsArticleWithSource(NewsArticleResponse):
     """Article with source details."""
     source_name: Optional[str] = None
@@ -1,7 +1,6 @@
 """Scene schemas."""
 
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
@@ -29,7 +28,7 @@ class SceneResponse(BaseModel):
     dialogue: Optional[str]
     action_description: Optional[str]
     video_clip_path: Optional[str]
-    duration_seconds: Decimal
+    duration_seconds: float
     generation_time_ms: Optional[int]
     retry_count: int
     last_error: Optional[str]
@@ -38,6 +37,9 @@ class SceneResponse(BaseModel):
 
 class SceneDetailResponse(SceneResponse):
     """Schema for scene detail response with prompts."""
+    # No route serves this yet; build the validator on first use, not at import
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
     script_prompt: Optional[str]
     script_response: Optional[str]
     ovi_prompt: Optional[str]
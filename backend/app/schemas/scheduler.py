@@ -1,19 +1,30 @@
 """Scheduler schemas for API."""
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
+from typing_extensions import TypedDict  # pydantic needs this one before Python 3.12
 
 from app.models.scheduler import JobStatus, JobTriggerType
 
 
+class ScrapeContext(TypedDict, total=False):
+    """News scrape settings stored on a job; read by NewsScraperService.scrape_for_context."""
+    __pydantic_config__ = ConfigDict(extra="forbid")  # A misspelled key is a 422, not silently dropped
+
+    type: str
+    focus: list[str]
+    date_range_hours: int
+    date_range_days: int
+
+
 class ScheduledJobBase(BaseModel):
     """Base scheduled job schema."""
     trigger_type: JobTriggerType
     scheduled_for: datetime
     description: Optional[str] = None
-    scrape_context: Optional[dict[str, Any]] = None
+    scrape_context: Optional[ScrapeContext] = None
 
 
 class ScheduledJobCreate(ScheduledJobBase):
@@ -14,7 +14,7 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-from sqlalchemy import delete, select, text
+from sqlalchemy import delete, insert, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import async_session_maker
@@ -42,44 +42,44 @@ async def load_calendar(session: AsyncSession, reset: bool = False) -> int:
         await session.execute(delete(Race).where(Race.season == calendar["season"]))
         print(f"   Deleted existing {calendar['season']} races")
     
-    races_created = 0
+    # One query for the rounds already seeded, instead of one per race
+    existing_rounds = set(
+        await session.scalars(select(Race.round_number).where(Race.season == calendar["season"]))
+    )
+    races = []
     
     for race_data in calendar["races"]:
-        # Check if race already exists
-        existing = await session.execute(
-            select(Race).where(
-                Race.season == calendar["season"],
-                Race.round_number == race_data["round"]
-            )
-        )
-        if existing.scalar_one_or_none():
+        if race_data["round"] in existing_rounds:
             print(f"   ⏭️  Race {race_data['round']} already exists, skipping")
             continue
         
         sessions = race_data.get("sessions", {})
         
-        race = Race(
-            season=calendar["season"],
-            round_number=race_data["round"],
-            race_name=race_data["name"],
-            circuit_name=race_data.get("circuit"),
-            country=race_data.get("country"),
-            race_date=datetime.strptime(race_data["date"], "%Y-%m-%d").date(),
-            is_sprint_weekend=race_data.get("is_sprint", False),
-            fp1_datetime=parse_datetime(sessions.get("fp1")),
-            fp2_datetime=parse_datetime(sessions.get("fp2")),
-            fp3_datetime=parse_datetime(sessions.get("fp3")),
-            qualifying_datetime=parse_datetime(sessions.get("qualifying")),
-            race_datetime=parse_datetime(sessions.get("race")),
-            sprint_qualifying_datetime=parse_datetime(sessions.get("sprint_qualifying")),
-            sprint_race_datetime=parse_datetime(sessions.get("sprint")),
+        races.append(
+            {
+                "season": calendar["season"],
+                "round_number": race_data["round"],
+                "race_name": race_data["name"],
+                "circuit_name": race_data.get("circuit"),
+                "country": race_data.get("country"),
+                "race_date": datetime.strptime(race_data["date"], "%Y-%m-%d").date(),
+                "is_sprint_weekend": race_data.get("is_sprint", False),
+                "fp1_datetime": parse_datetime(sessions.get("fp1")),
+                "fp2_datetime": parse_datetime(sessions.get("fp2")),
+                "fp3_datetime": parse_datetime(sessions.get("fp3")),
+                "qualifying_datetime": parse_datetime(sessions.get("qualifying")),
+                "race_datetime": parse_datetime(sessions.get("race")),
+                "sprint_qualifying_datetime": parse_datetime(sessions.get("sprint_qualifying")),
+                "sprint_race_datetime": parse_datetime(sessions.get("sprint")),
+            }
         )
-        session.add(race)
-        races_created += 1
         print(f"   ✅ {race_data['name']}" + (" 🏎️ Sprint" if race_data.get("is_sprint") else ""))
     
+    # Core executemany INSERT; no ORM objects are needed for seed rows
+    if races:
+        await session.execute(insert(Race), races)
     await session.commit()
-    return races_created
+    return len(races)
 
 
 async def load_characters(session: AsyncSession, reset: bool = False) -> int:
@@ -89,37 +89,36 @@ async def load_characters(session: AsyncSession, reset: bool = False) -> int:
         print("   Deleted existing characters")
     
     characters_created = 0
+    existing_ids = set(await session.scalars(select(Character.character_id)))
     
     # Load drivers
     drivers_dir = CHARACTER_DIR / "drivers"
     if drivers_dir.exists():
         for json_file in drivers_dir.glob("*.json"):
-            if await load_character_file(session, json_file, "driver"):
+            if await load_character_file(session, json_file, "driver", existing_ids):
                 characters_created += 1
     
     # Load team principals
     principals_dir = CHARACTER_DIR / "principals"
     if principals_dir.exists():
         for json_file in principals_dir.glob("*.json"):
-            if await load_character_file(session, json_file, "principal"):
+            if await load_character_file(session, json_file, "principal", existing_ids):
                 characters_created += 1
     
     await session.commit()
     return characters_created
 
 
-async def load_character_file(session: AsyncSession, json_path: Path, role: str) -> bool:
-    """Load a single character from JSON file."""
+async def load_character_file(
+    session: AsyncSession, json_path: Path, role: str, existing_ids: set[str]
+) -> bool:
+    """Load a single character from JSON file, skipping IDs in ``existing_ids``."""
     with open(json_path, "r") as f:
         data = json.load(f)
     
     char_id = data.get("id", json_path.stem)
     
-    # Check if exists
-    existing = await session.execute(
-        select(Character).where(Character.character_id == char_id)
-    )
-    if existing.scalar_one_or_none():
+    if char_id in existing_ids:
         print(f"   ⏭️  Character {char_id} already exists, skipping")
         return False
     
@@ -144,6 +143,7 @@ async def load_character_file(session: AsyncSession, json_path: Path, role: str)
         is_active=True,
     )
     session.add(character)
+    existing_ids.add(char_id)
     print(f"   ✅ {data.get('name', char_id)} ({role})")
     return True
 
@@ -153,7 +153,8 @@ def parse_datetime(dt_string: str | None) -> datetime | None:
     if not dt_string:
         return None
     try:
-        return datetime.fromisoformat(dt_string.replace("Z", "+00:00"))
+        # Python 3.11+ parses a trailing "Z" as UTC directly
+        return datetime.fromisoformat(dt_string)
     except ValueError:
         return None
 
@@ -2,12 +2,22 @@
 
 from app.services.scheduler import SchedulerService
 from app.services.news_scraper import NewsScraperService
-from app.services.ovi_space_manager import OviSpaceManager, SpaceStatus, generate_episode_videos
+from app.services.usage_rollup import UsageRollupService
 
 __all__ = [
     "SchedulerService",
     "NewsScraperService",
+    "UsageRollupService",
     "OviSpaceManager",
     "SpaceStatus",
     "generate_episode_videos",
 ]
+
+
+def __getattr__(name: str):
+    # Only the pipeline drives Ovi; keep huggingface_hub out of API startup
+    if name in ("OviSpaceManager", "SpaceStatus", "generate_episode_videos"):
+        from app.services import ovi_space_manager
+
+        return getattr(ovi_space_manager, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -18,8 +18,10 @@ import httpx
 from bs4 import BeautifulSoup
 from sqlalchemy import select, and_, desc
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
 from app.models import NewsSource, NewsArticle, ArticleContext
+from app.models.news import url_digest
 from app.models.scheduler import JobTriggerType
 
 logger = logging.getLogger(__name__)
@@ -41,21 +43,37 @@ F1_TEAMS = [
 ]
 
 
-class NewsScraperService:
-    """Scrapes and processes F1 news from various sources."""
+_http_client: Optional[httpx.AsyncClient] = None
 
-    def __init__(self, session: AsyncSession):
-        self.session = session
-        self.http_client = httpx.AsyncClient(
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared scraping HTTP client, so keep-alive connections are reused."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
             timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
             headers={
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
             }
         )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared scraping HTTP client (application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
-    async def close(self):
-        """Close HTTP client."""
-        await self.http_client.aclose()
+
+class NewsScraperService:
+    """Scrapes and processes F1 news from various sources."""
+
+    def __init__(self, session: AsyncSession, http_client: Optional[httpx.AsyncClient] = None):
+        self.session = session
+        self.http_client = http_client or get_http_client()
 
     async def scrape_for_context(
         self,
@@ -245,10 +263,10 @@ class NewsScraperService:
 
     async def _article_exists(self, url: str) -> bool:
         """Check if an article URL already exists in database."""
-        result = await self.session.execute(
-            select(NewsArticle).where(NewsArticle.url == url)
+        article_id = await self.session.scalar(
+            select(NewsArticle.id).where(NewsArticle.url_hash == url_digest(url))
         )
-        return result.scalar_one_or_none() is not None
+        return article_id is not None
 
     async def _process_articles(
         self,
@@ -413,6 +431,7 @@ class NewsScraperService:
         
         query = (
             select(NewsArticle)
+            .options(undefer_group("heavy"))
             .where(
                 and_(
                     NewsArticle.context == context,
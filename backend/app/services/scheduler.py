@@ -19,6 +19,7 @@ from zoneinfo import ZoneInfo
 
 from sqlalchemy import select, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.models import Race, ScheduledJob, JobStatus, JobTriggerType, EpisodeType
 
@@ -260,6 +261,7 @@ class SchedulerService:
         
         result = await self.session.execute(
             select(ScheduledJob)
+            .options(selectinload(ScheduledJob.race), raiseload("*"))
             .where(
                 and_(
                     ScheduledJob.scheduled_for >= now,
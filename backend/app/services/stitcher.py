@@ -1,5 +1,7 @@
 """Video stitching service using ffmpeg."""
 
+import asyncio
+import json
 import logging
 import os
 import subprocess
@@ -65,28 +67,27 @@ class VideoStitcher:
         output_path = episode_dir / "final.mp4"
 
         # Build ffmpeg command
-        cmd = [
-            "ffmpeg",
-            "-f", "concat",
-            "-safe", "0",
-            "-i", str(file_list_path),
+        concat_input = ["ffmpeg", "-f", "concat", "-safe", "0", "-i", str(file_list_path)]
+        encode_args = [
             "-c:v", self.codec,
             "-c:a", self.audio_codec,
             "-preset", "medium",
             "-crf", str(self.crf),
-            "-y",  # Overwrite output
-            str(output_path),
         ]
-
-        logger.info(f"Running ffmpeg: {' '.join(cmd)}")
+        # Ovi clips normally share one format; then the streams are copied
+        # as-is instead of decoded and re-encoded
+        copy_args = ["-c", "copy", "-movflags", "+faststart"]
+        output_args = ["-y", str(output_path)]  # Overwrite output
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
-            )
+            result = None
+            if await asyncio.to_thread(self._clips_share_format, clip_paths):
+                result = await self._run_ffmpeg(concat_input + copy_args + output_args)
+                if result.returncode != 0:
+                    logger.warning(f"Stream copy failed, re-encoding: {result.stderr}")
+
+            if result is None or result.returncode != 0:
+                result = await self._run_ffmpeg(concat_input + encode_args + output_args)
 
             if result.returncode != 0:
                 logger.error(f"ffmpeg failed: {result.stderr}")
@@ -111,6 +112,38 @@ class VideoStitcher:
             logger.error("ffmpeg not found in PATH")
             raise VideoStitchError("ffmpeg not installed or not in PATH")
 
+    async def _run_ffmpeg(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """Run an ffmpeg command off the event loop."""
+        logger.info(f"Running ffmpeg: {' '.join(cmd)}")
+        return await asyncio.to_thread(
+            subprocess.run,
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=300,  # 5 minute timeout
+        )
+
+    def _clips_share_format(self, clip_paths: List[str]) -> bool:
+        """Check with ffprobe that all clips can be concatenated without re-encoding."""
+        signatures = set()
+        for clip_path in clip_paths:
+            cmd = [
+                "ffprobe",
+                "-v", "error",
+                "-show_entries",
+                "stream=codec_type,codec_name,profile,width,height,pix_fmt,r_frame_rate,time_base,sample_rate,channels",
+                "-of", "json",
+                clip_path,
+            ]
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                streams = json.loads(result.stdout)["streams"]
+            except Exception as e:
+                logger.warning(f"Could not probe {clip_path}: {e}")
+                return False
+            signatures.add(json.dumps(streams, sort_keys=True))
+        return len(signatures) == 1
+
     def _get_duration(self, video_path: str) -> int:
         """Get video duration in seconds using ffprobe."""
         try:
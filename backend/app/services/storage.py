@@ -1,9 +1,12 @@
 """MinIO storage service."""
 
+import asyncio
 import logging
+import tempfile
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from minio import Minio
 from minio.error import S3Error
@@ -13,6 +16,13 @@ from app.exceptions import StorageError
 
 logger = logging.getLogger(__name__)
 
+# Local cache of character images, keyed by object ETag
+CHARACTER_IMAGE_CACHE_DIR = Path(tempfile.gettempdir()) / "f1-characters"
+_download_locks: dict[str, asyncio.Lock] = {}
+
+# Multipart chunk size for streamed uploads (MinIO minimum is 5 MiB)
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
 
 class StorageService:
     """Service for managing object storage with MinIO."""
@@ -86,15 +96,40 @@ class StorageService:
         content_type: str = "application/octet-stream",
     ) -> str:
         """Upload bytes data to MinIO."""
-        logger.info(f"Uploading bytes to MinIO: {bucket}/{object_name}")
+        return await self.upload_stream(
+            bucket,
+            object_name,
+            BytesIO(data),
+            length=len(data),
+            content_type=content_type,
+        )
+
+    async def upload_stream(
+        self,
+        bucket: str,
+        object_name: str,
+        data: BinaryIO,
+        length: int = -1,
+        content_type: str = "application/octet-stream",
+    ) -> str:
+        """
+        Upload a file-like object to MinIO without buffering it in memory.
+
+        Args:
+            length: Size in bytes, or -1 if unknown (uploaded in multipart chunks)
+        """
+        logger.info(f"Uploading stream to MinIO: {bucket}/{object_name}")
 
         try:
-            self.client.put_object(
+            # The multipart upload blocks while it reads the stream, so keep it off the event loop
+            await asyncio.to_thread(
+                self.client.put_object,
                 bucket,
                 object_name,
-                BytesIO(data),
-                length=len(data),
+                data,
+                length=length,
                 content_type=content_type,
+                part_size=UPLOAD_PART_SIZE,
             )
             full_path = f"{bucket}/{object_name}"
             return full_path
@@ -112,7 +147,8 @@ class StorageService:
         logger.info(f"Downloading from MinIO: {bucket}/{object_name}")
 
         try:
-            self.client.fget_object(bucket, object_name, file_path)
+            # Run the blocking MinIO call in a worker thread so concurrent downloads overlap
+            await asyncio.to_thread(self.client.fget_object, bucket, object_name, file_path)
             logger.debug(f"Downloaded to: {file_path}")
         except S3Error as e:
             logger.error(f"Download failed: {e}")
@@ -148,18 +184,20 @@ class StorageService:
     async def upload_character_image(
         self,
         object_name: str,
-        data: bytes,
+        data: BinaryIO,
+        length: int = -1,
     ) -> str:
-        """Upload a character reference image."""
+        """Stream a character reference image to MinIO."""
         content_type = "image/png"
         if object_name.lower().endswith(".jpg") or object_name.lower().endswith(".jpeg"):
             content_type = "image/jpeg"
 
-        return await self.upload_bytes(
+        return await self.upload_stream(
             settings.MINIO_BUCKET_CHARACTERS,
             object_name,
             data,
-            content_type,
+            length=length,
+            content_type=content_type,
         )
 
     async def download_character_image(self, storage_path: str) -> str:
@@ -170,11 +208,8 @@ class StorageService:
             storage_path: Full path like "f1-characters/max_verstappen.png" or just object name
             
         Returns:
-            Local file path to downloaded image
+            Local file path to downloaded (or cached) image
         """
-        import tempfile
-        from pathlib import Path
-        
         # Parse bucket and object name from path
         if "/" in storage_path:
             parts = storage_path.split("/", 1)
@@ -185,19 +220,36 @@ class StorageService:
         else:
             object_name = storage_path
         
-        # Create temp file with correct extension
+        # Images are immutable per upload, so cache them locally by ETag
+        try:
+            stat = await asyncio.to_thread(
+                self.client.stat_object, settings.MINIO_BUCKET_CHARACTERS, object_name
+            )
+        except S3Error as e:
+            logger.error(f"Stat failed: {e}")
+            raise StorageError(f"Stat failed: {e}")
+
+        etag = stat.etag.strip('"')
         ext = Path(object_name).suffix or ".png"
-        temp_dir = Path(tempfile.gettempdir()) / "f1-characters"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        local_path = str(temp_dir / f"{Path(object_name).stem}{ext}")
-        
-        await self.download_file(
-            settings.MINIO_BUCKET_CHARACTERS,
-            object_name,
-            local_path,
-        )
+        CHARACTER_IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = CHARACTER_IMAGE_CACHE_DIR / f"{etag}{ext}"
+
+        if cache_path.exists():
+            logger.debug(f"Character image cache hit: {object_name}")
+            return str(cache_path)
+
+        # Coalesce concurrent downloads of the same object
+        lock = _download_locks.setdefault(cache_path.name, asyncio.Lock())
+        async with lock:
+            if not cache_path.exists():
+                # fget_object writes to a .part file and renames it into place
+                await self.download_file(
+                    settings.MINIO_BUCKET_CHARACTERS,
+                    object_name,
+                    str(cache_path),
+                )
         
-        return local_path
+        return str(cache_path)
 
     async def upload_scene_image(
         self,
@@ -229,6 +281,21 @@ class StorageService:
             file_path,
         )
 
+    async def download_video_clip(self, storage_path: str, file_path: str) -> str:
+        """
+        Download a generated video clip to a local path.
+
+        Args:
+            storage_path: Path returned by upload_video_clip ("bucket/object_name")
+            file_path: Local destination
+
+        Returns:
+            The local file path
+        """
+        bucket, object_name = storage_path.split("/", 1)
+        await self.download_file(bucket, object_name, file_path)
+        return file_path
+
     async def upload_final_video(
         self,
         race_id: int,
@@ -267,3 +334,9 @@ class StorageService:
         logger.info(f"Cleanup complete: {total_deleted} files, {total_bytes / 1024 / 1024:.2f} MB freed")
 
         return total_deleted, total_bytes
+
+
+@lru_cache
+def get_storage() -> StorageService:
+    """Get the shared storage service, so the MinIO connection pool is reused."""
+    return StorageService()
@@ -0,0 +1,82 @@
+"""Daily API usage rollup service."""
+
+import logging
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import Date, cast, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.logs import APIUsage, APIUsageDaily
+
+logger = logging.getLogger(__name__)
+
+# Completed days re-aggregated on every refresh. created_at defaults to
+# now(), the transaction start, so a transaction spanning midnight can
+# commit rows for a day that was already rolled up.
+ROLLUP_LOOKBACK_DAYS = 2
+
+
+class UsageRollupService:
+    """Maintains the ``api_usage_daily`` rollup of completed days."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def refresh(self, until: date) -> None:
+        """
+        Roll up every completed day before ``until``.
+
+        Days after the latest rolled-up day are aggregated, plus the last
+        ``ROLLUP_LOOKBACK_DAYS`` completed days again to pick up late
+        commits. Concurrent refreshes are safe thanks to the upsert on
+        ``(day, provider)``.
+        """
+        last_day = (await self.session.execute(select(func.max(APIUsageDaily.day)))).scalar()
+        since = None
+        if last_day:
+            since = min(last_day + timedelta(days=1), until - timedelta(days=ROLLUP_LOOKBACK_DAYS))
+
+        day = cast(APIUsage.created_at, Date)
+        source = (
+            select(
+                day,
+                APIUsage.provider,
+                func.count(APIUsage.id),
+                func.coalesce(func.sum(APIUsage.cost_usd), 0),
+                func.coalesce(func.sum(APIUsage.input_tokens), 0),
+                func.coalesce(func.sum(APIUsage.output_tokens), 0),
+                func.avg(func.nullif(APIUsage.response_time_ms, 0)),
+            )
+            .where(APIUsage.created_at < datetime.combine(until, datetime.min.time()))
+            .group_by(day, APIUsage.provider)
+        )
+        if since:
+            source = source.where(APIUsage.created_at >= datetime.combine(since, datetime.min.time()))
+
+        stmt = insert(APIUsageDaily).from_select(
+            [
+                APIUsageDaily.day,
+                APIUsageDaily.provider,
+                APIUsageDaily.api_calls,
+                APIUsageDaily.cost_usd,
+                APIUsageDaily.input_tokens,
+                APIUsageDaily.output_tokens,
+                APIUsageDaily.avg_response_time_ms,
+            ],
+            source,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[APIUsageDaily.day, APIUsageDaily.provider],
+            set_={
+                "api_calls": stmt.excluded.api_calls,
+                "cost_usd": stmt.excluded.cost_usd,
+                "input_tokens": stmt.excluded.input_tokens,
+                "output_tokens": stmt.excluded.output_tokens,
+                "avg_response_time_ms": stmt.excluded.avg_response_time_ms,
+                "refreshed_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+
+        logger.info(f"Rolled up API usage from {since or 'the beginning'} until {until}")
@@ -0,0 +1,32 @@
+"""RQ worker that runs queued video pipeline jobs and the scheduled usage rollup.
+
+Usage:
+    python -m app.worker
+"""
+
+import logging
+
+from rq import Worker
+
+from app.config import settings
+from app.pipeline.tasks import get_pipeline_queue, schedule_usage_rollup
+
+logging.basicConfig(
+    level=settings.log_level,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """Start a worker on the pipeline queue."""
+    queue = get_pipeline_queue()
+    logger.info(f"Scheduled usage rollup job {schedule_usage_rollup()}")
+    logger.info(f"Starting pipeline worker on queue '{queue.name}'")
+    # The scheduler moves enqueue_at jobs (the usage rollup) onto the queue when due
+    Worker([queue], connection=queue.connection).work(with_scheduler=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -112,3 +112,22 @@ class TestAnalyticsAPI:
         data = response.json()
         assert "total_episodes" in data
         assert "success_rate" in data
+
+
+class TestRouting:
+    """Tests for router registration."""
+
+    def test_no_duplicate_routes(self):
+        """Test each method/path pair is registered by exactly one route."""
+        from fastapi.routing import APIRoute
+
+        from app.main import app
+
+        seen = set()
+        for route in app.routes:
+            if not isinstance(route, APIRoute):
+                continue
+            for method in route.methods:
+                key = (method, route.path)
+                assert key not in seen, f"Duplicate route: {method} {route.path}"
+                seen.add(key)
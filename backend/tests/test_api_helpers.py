@@ -0,0 +1,153 @@
+"""Tests for API helpers: keyset cursors, character ID parsing and ETags."""
+
+import base64
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, create_engine, desc, insert, select, tuple_
+
+from app import cache
+from app.api.gags import MAX_CHARACTER_IDS, _parse_character_ids
+from app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.database import get_db
+from app.main import app
+
+
+class TestCursorPagination:
+    """Tests for keyset pagination cursors."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the sort key it was built from."""
+        scraped_at = datetime(2026, 3, 15, 14, 30, 5, 123456)
+        assert decode_cursor(encode_cursor(scraped_at, 42)) == (scraped_at, 42)
+
+    def test_cursor_is_url_safe(self):
+        """Test cursors can be passed back as a query parameter unescaped."""
+        cursor = encode_cursor(datetime(2026, 3, 15, 14, 30), 2**40)
+        assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_=")
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not a cursor!",
+            base64.urlsafe_b64encode(b"2026-03-15T14:30:00").decode(),  # No row ID
+            base64.urlsafe_b64encode(b"2026-03-15T14:30:00|x").decode(),
+            base64.urlsafe_b64encode(b"yesterday|1").decode(),
+            base64.urlsafe_b64encode(b"2026-03-15T14:30:00|1|2").decode(),
+            base64.urlsafe_b64encode(b"\xff\xfe|1").decode(),  # Not UTF-8
+        ],
+    )
+    def test_invalid_cursor_is_400(self, cursor: str):
+        """Test tampered or malformed cursors are rejected as a bad request."""
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor)
+        assert exc_info.value.status_code == 400
+
+    def test_tie_break_on_id(self):
+        """Test paging through rows that share a sort value skips and repeats nothing."""
+        metadata = MetaData()
+        rows = Table(
+            "rows",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("scraped_at", DateTime, nullable=False),
+        )
+        engine = create_engine("sqlite://")
+        metadata.create_all(engine)
+
+        base = datetime(2026, 3, 15, 12, 0)
+        # Seven rows share one timestamp, so every page boundary falls inside a tie
+        timestamps = [base] * 7 + [base - timedelta(minutes=1)] * 3 + [base + timedelta(minutes=1)] * 2
+        with engine.begin() as conn:
+            conn.execute(insert(rows), [{"id": i + 1, "scraped_at": ts} for i, ts in enumerate(timestamps)])
+
+        # Same ordering and seek predicate as the list endpoints
+        seen = []
+        after = None
+        with engine.connect() as conn:
+            while True:
+                query = select(rows).order_by(desc(rows.c.scraped_at), desc(rows.c.id)).limit(3)
+                if after:
+                    query = query.where(tuple_(rows.c.scraped_at, rows.c.id) < decode_cursor(after))
+                page = conn.execute(query).all()
+                seen.extend(row.id for row in page)
+                if len(page) < 3:
+                    break
+                after = encode_cursor(page[-1].scraped_at, page[-1].id)
+
+        expected = [
+            row_id
+            for _, row_id in sorted(((ts, i + 1) for i, ts in enumerate(timestamps)), reverse=True)
+        ]
+        assert seen == expected
+
+
+class TestParseCharacterIds:
+    """Tests for the gags character_ids query parameter."""
+
+    def test_comma_and_whitespace_separated(self):
+        """Test IDs may be separated by any run of commas and spaces."""
+        assert _parse_character_ids("1,2, 3 4") == (1, 2, 3, 4)
+        assert _parse_character_ids(" 7 ") == (7,)
+        assert _parse_character_ids("1,,3") == (1, 3)
+
+    def test_max_ids_allowed(self):
+        """Test exactly MAX_CHARACTER_IDS IDs are accepted."""
+        ids = ",".join(str(i) for i in range(MAX_CHARACTER_IDS))
+        assert _parse_character_ids(ids) == tuple(range(MAX_CHARACTER_IDS))
+
+    def test_too_many_ids_is_400(self):
+        """Test one ID over the cap is rejected."""
+        ids = ",".join(str(i) for i in range(MAX_CHARACTER_IDS + 1))
+        with pytest.raises(HTTPException) as exc_info:
+            _parse_character_ids(ids)
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.parametrize("character_ids", ["1,two,3", "1.5", "1,2,", "", "   "])
+    def test_malformed_or_blank_is_400(self, character_ids: str):
+        """Test non-integer, empty and blank values are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            _parse_character_ids(character_ids)
+        assert exc_info.value.status_code == 400
+
+
+class TestETags:
+    """Tests for ETag generation and conditional GETs."""
+
+    def test_make_etag_is_stable(self):
+        """Test the same parts always give the same quoted ETag."""
+        updated = datetime(2026, 3, 15, 12, 0)
+        etag = cache.make_etag(50, None, 12, updated)
+        assert etag == cache.make_etag(50, None, 12, updated)
+        assert etag.startswith('"') and etag.endswith('"')
+
+    def test_make_etag_changes_with_parts(self):
+        """Test any change to the version parts changes the ETag."""
+        etag = cache.make_etag(50, None, 12, "2026-03-15T12:00:00")
+        assert etag != cache.make_etag(50, None, 13, "2026-03-15T12:00:00")
+        assert etag != cache.make_etag(50, None, 12, "2026-03-15T12:00:01")
+        assert etag != cache.make_etag(100, None, 12, "2026-03-15T12:00:00")
+
+    def test_matching_if_none_match_is_304(self, monkeypatch: pytest.MonkeyPatch):
+        """Test a poller holding the current ETag gets a 304 without a page query."""
+        version = [12, "2026-03-15T12:00:00"]
+
+        async def cached_version(key, loader, ttl=cache.DEFAULT_TTL_SECONDS):
+            return version
+
+        async def no_db():
+            yield None  # The 304 path must not touch the session
+
+        monkeypatch.setattr(cache, "get_or_set", cached_version)
+        app.dependency_overrides[get_db] = no_db
+        try:
+            etag = cache.make_etag(50, None, *version)
+            response = TestClient(app).get("/api/v1/news/articles", headers={"If-None-Match": etag})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert NEXT_CURSOR_HEADER not in response.headers
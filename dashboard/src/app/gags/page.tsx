@@ -633,8 +633,8 @@ export default function GagsPage() {
                 <div className="flex items-center justify-between border-t border-white/5 bg-twilight/20 px-5 py-3">
                   <span className="text-xs text-white/30 font-mono">
                     #{gag.id}
-                    {gag.usages.length > 0 && (
-                      <span className="ml-2">{gag.usages.length} usage{gag.usages.length !== 1 ? "s" : ""}</span>
+                    {gag.times_used > 0 && (
+                      <span className="ml-2">{gag.times_used} usage{gag.times_used !== 1 ? "s" : ""}</span>
                     )}
                   </span>
                   <div className="flex gap-2">
@@ -1,7 +1,7 @@
 "use client";
 
 import { useEffect, useState } from "react";
-import { api, NewsSource, NewsArticle, ArticleContext } from "@/lib/api";
+import { api, NewsSource, NewsArticleSummary, ArticleContext } from "@/lib/api";
 import { formatDateTime, formatRelativeTime } from "@/lib/utils";
 import { Header } from "@/components/layout/Header";
 import { Button, Card, LoadingPage } from "@/components/ui";
@@ -15,7 +15,7 @@ const contextColors: Record<ArticleContext, string> = {
 
 export default function NewsPage() {
   const [sources, setSources] = useState<NewsSource[]>([]);
-  const [articles, setArticles] = useState<NewsArticle[]>([]);
+  const [articles, setArticles] = useState<NewsArticleSummary[]>([]);
   const [loading, setLoading] = useState(true);
   const [scraping, setScraping] = useState(false);
   const [error, setError] = useState<string | null>(null);
@@ -224,18 +224,6 @@ export default function NewsPage() {
                     {article.published_at && (
                       <span>{formatRelativeTime(article.published_at)}</span>
                     )}
-                    {article.mentioned_drivers && article.mentioned_drivers.length > 0 && (
-                      <>
-                        <span>•</span>
-                        <span>Drivers: {article.mentioned_drivers.join(", ")}</span>
-                      </>
-                    )}
-                    {article.mentioned_teams && article.mentioned_teams.length > 0 && (
-                      <>
-                        <span>•</span>
-                        <span>Teams: {article.mentioned_teams.join(", ")}</span>
-                      </>
-                    )}
                   </div>
                 </div>
                 
@@ -86,6 +86,12 @@ export interface NewsArticle {
   created_at: string;
 }
 
+// Listings leave out the full text and extracted keywords/mentions
+export type NewsArticleSummary = Omit<
+  NewsArticle,
+  "full_content" | "keywords" | "mentioned_drivers" | "mentioned_teams"
+>;
+
 export interface EpisodeStoryline {
   id: number;
   episode_id: number;
@@ -188,7 +194,7 @@ export interface RunningGag {
   is_active: boolean;
   created_at: string;
   updated_at: string;
-  usages: GagUsage[];
+  usages?: GagUsage[]; // Only returned by get/create/update
 }
 
 export interface GagUsage {
@@ -456,7 +462,7 @@ export const newsApi = {
     if (params?.used !== undefined) searchParams.set("used", String(params.used));
     if (params?.limit) searchParams.set("limit", String(params.limit));
     const query = searchParams.toString();
-    return request<NewsArticle[]>(`/news/articles${query ? `?${query}` : ""}`);
+    return request<NewsArticleSummary[]>(`/news/articles${query ? `?${query}` : ""}`);
   },
   
   getArticle: (id: number) => request<NewsArticle>(`/news/articles/${id}`),
@@ -0,0 +1,59 @@
+-- ============================================
+-- ANTIKYTHERA F1 VIDEO GENERATOR
+-- Daily API Usage Rollup
+-- Version: 006
+-- Date: 2026-10-15
+-- ============================================
+-- Pre-aggregates completed days of api_usage per provider
+-- so the analytics endpoints only scan raw rows for days
+-- after the latest rolled-up day (normally just today).
+-- The RQ worker refreshes it on a schedule
+-- (schedule_usage_rollup / run_usage_rollup_job, every
+-- USAGE_ROLLUP_INTERVAL_SECONDS, hourly by default). Each
+-- run rolls up new completed days and re-aggregates the
+-- last 2 (ROLLUP_LOOKBACK_DAYS) to pick up late commits.
+-- Staleness: a completed day can miss usage committed late
+-- for up to one interval; usage committed more than 2 days
+-- after its created_at is never picked up. If the worker
+-- stops, analytics stay complete but scan more raw rows.
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS api_usage_daily (
+    day DATE NOT NULL,
+    provider api_provider NOT NULL,
+
+    api_calls INTEGER NOT NULL DEFAULT 0,
+    cost_usd DECIMAL(12, 6) NOT NULL DEFAULT 0,
+    input_tokens BIGINT NOT NULL DEFAULT 0,
+    output_tokens BIGINT NOT NULL DEFAULT 0,
+    avg_response_time_ms DECIMAL(12, 2),  -- Ignores calls without a recorded response time
+
+    refreshed_at TIMESTAMP DEFAULT NOW(),
+
+    PRIMARY KEY (day, provider)
+);
+
+COMMENT ON TABLE api_usage_daily IS 'Daily per-provider rollup of api_usage for cost analytics';
+
+-- Backfill all completed days
+INSERT INTO api_usage_daily (day, provider, api_calls, cost_usd, input_tokens, output_tokens, avg_response_time_ms)
+SELECT
+    created_at::date,
+    provider,
+    COUNT(*),
+    COALESCE(SUM(cost_usd), 0),
+    COALESCE(SUM(input_tokens), 0),
+    COALESCE(SUM(output_tokens), 0),
+    AVG(NULLIF(response_time_ms, 0))
+FROM api_usage
+WHERE created_at < CURRENT_DATE
+GROUP BY 1, 2
+ON CONFLICT (day, provider) DO NOTHING;
+
+-- ============================================
+-- MIGRATION RECORD
+-- ============================================
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('006', 'Daily API usage rollup table for cost analytics')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,30 @@
+-- ============================================
+-- ANTIKYTHERA F1 VIDEO GENERATOR
+-- Analytics Covering Indexes
+-- Version: 007
+-- Date: 2026-10-15
+-- ============================================
+-- Composite covering indexes for the analytics range scans
+-- (created_at ranges grouped by provider / status) so the
+-- aggregates can be served with index-only scans.
+--
+-- NOTE: CREATE INDEX CONCURRENTLY cannot run inside a
+-- transaction block. Run this file with psql in autocommit
+-- mode (no --single-transaction).
+-- ============================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_api_usage_created_provider
+    ON api_usage(created_at, provider)
+    INCLUDE (cost_usd, input_tokens, output_tokens, response_time_ms);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_episodes_created_status
+    ON episodes(created_at, status)
+    INCLUDE (generation_time_seconds, scene_count, total_cost_usd);
+
+-- ============================================
+-- MIGRATION RECORD
+-- ============================================
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('007', 'Covering indexes for analytics created_at range scans')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,31 @@
+-- ============================================
+-- ANTIKYTHERA F1 VIDEO GENERATOR
+-- One Primary Image Per Character
+-- Version: 008
+-- Date: 2026-10-15
+-- ============================================
+-- Enforces at most one primary image per character.
+-- Existing duplicates are resolved by keeping the most
+-- recently created primary image.
+-- ============================================
+
+UPDATE character_images ci
+SET is_primary = FALSE
+WHERE ci.is_primary = TRUE
+AND EXISTS (
+    SELECT 1 FROM character_images newer
+    WHERE newer.character_id = ci.character_id
+    AND newer.is_primary = TRUE
+    AND (newer.created_at, newer.id) > (ci.created_at, ci.id)
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_character_images_primary
+    ON character_images(character_id) WHERE is_primary;
+
+-- ============================================
+-- MIGRATION RECORD
+-- ============================================
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('008', 'Partial unique index enforcing one primary image per character')
+ON CONFLICT (version) DO NOTHING;
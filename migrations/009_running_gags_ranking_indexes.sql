@@ -0,0 +1,27 @@
+-- ============================================
+-- ANTIKYTHERA F1 VIDEO GENERATOR
+-- Running Gags Ranking Indexes
+-- Version: 009
+-- Date: 2026-10-15
+-- ============================================
+-- Indexes matching the gag listing filters and their
+-- humor_rating ordering, so the planner can walk the index
+-- instead of sorting the filtered rows.
+-- ============================================
+
+-- GET /gags: is_active filter, ordered by humor_rating, created_at
+CREATE INDEX IF NOT EXISTS idx_running_gags_active_humor
+    ON running_gags(is_active, humor_rating DESC, created_at DESC);
+
+-- GET /gags/for-episode: active gags by status, ordered by humor_rating
+CREATE INDEX IF NOT EXISTS idx_running_gags_available
+    ON running_gags(status, humor_rating DESC)
+    WHERE is_active = TRUE;
+
+-- ============================================
+-- MIGRATION RECORD
+-- ============================================
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('009', 'Running gags indexes for humor_rating ordered listings')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,20 @@
+-- ============================================
+-- ANTIKYTHERA F1 VIDEO GENERATOR
+-- News Articles updated_at
+-- Version: 010
+-- Date: 2026-10-15
+-- ============================================
+-- Adds updated_at to news_articles so list responses can be
+-- versioned (ETag) from MAX(updated_at) like running_gags.
+-- ============================================
+
+ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP DEFAULT NOW();
+COMMENT ON COLUMN news_articles.updated_at IS 'Last modification time, maintained by the application';
+
+-- ============================================
+-- MIGRATION RECORD
+-- ============================================
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('010', 'Add updated_at to news_articles')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,24 @@
+-- ============================================
+-- ANTIKYTHERA F1 VIDEO GENERATOR
+-- Keyset Pagination Indexes
+-- Version: 011
+-- Date: 2026-10-15
+-- ============================================
+-- Composite indexes matching the (sort column, id) keyset
+-- used by the article and job listings, so each page is an
+-- index seek instead of a sort.
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_news_articles_scraped_id
+    ON news_articles(scraped_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_scheduled_jobs_scheduled_id
+    ON scheduled_jobs(scheduled_for DESC, id DESC);
+
+-- ============================================
+-- MIGRATION RECORD
+-- ============================================
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('011', 'Keyset pagination indexes for article and job listings')
+ON CONFLICT (version) DO NOTHING;
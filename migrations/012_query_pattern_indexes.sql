@@ -0,0 +1,44 @@
+-- ============================================
+-- ANTIKYTHERA F1 VIDEO GENERATOR
+-- Query Pattern Indexes
+-- Version: 012
+-- Date: 2026-10-15
+-- ============================================
+-- Composite and partial indexes for the filters the API
+-- actually uses: episodes by race + status, API usage by
+-- episode + provider, log tails by episode newest first and
+-- unprocessed articles by context. The single-column
+-- indexes they supersede are dropped (each is a prefix of
+-- its replacement), so writes don't pay for both.
+-- Active gag titles become unique.
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_episodes_race_status
+    ON episodes(race_id, status);
+DROP INDEX IF EXISTS idx_episodes_race;
+
+CREATE INDEX IF NOT EXISTS idx_api_usage_episode_provider
+    ON api_usage(episode_id, provider);
+DROP INDEX IF EXISTS idx_api_usage_episode;
+
+CREATE INDEX IF NOT EXISTS idx_logs_episode_created
+    ON generation_logs(episode_id, created_at DESC);
+DROP INDEX IF EXISTS idx_logs_episode;
+
+CREATE INDEX IF NOT EXISTS idx_news_articles_unprocessed
+    ON news_articles(context)
+    WHERE NOT is_processed;
+
+-- Fails if duplicate active titles already exist; deactivate
+-- or rename the duplicates first.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_running_gags_active_title
+    ON running_gags(title)
+    WHERE is_active;
+
+-- ============================================
+-- MIGRATION RECORD
+-- ============================================
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('012', 'Composite and partial indexes for episode, usage, log, article and gag queries')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,36 @@
+-- ============================================
+-- ANTIKYTHERA F1 VIDEO GENERATOR
+-- GIN Indexes for Array and JSONB Columns
+-- Version: 013
+-- Date: 2026-10-15
+-- ============================================
+-- Containment/overlap searches (@>, &&, ?) on article
+-- mentions and keywords, gag tags, log details and storyline
+-- facts use these instead of scanning the table.
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_news_articles_keywords
+    ON news_articles USING gin (keywords);
+
+CREATE INDEX IF NOT EXISTS idx_news_articles_drivers
+    ON news_articles USING gin (mentioned_drivers);
+
+CREATE INDEX IF NOT EXISTS idx_news_articles_teams
+    ON news_articles USING gin (mentioned_teams);
+
+CREATE INDEX IF NOT EXISTS idx_running_gags_tags
+    ON running_gags USING gin (tags);
+
+CREATE INDEX IF NOT EXISTS idx_logs_details
+    ON generation_logs USING gin (details);
+
+CREATE INDEX IF NOT EXISTS idx_episode_storylines_key_facts
+    ON episode_storylines USING gin (key_facts);
+
+-- ============================================
+-- MIGRATION RECORD
+-- ============================================
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('013', 'GIN indexes for array and JSONB search columns')
+ON CONFLICT (version) DO NOTHING;
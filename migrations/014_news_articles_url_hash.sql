@@ -0,0 +1,28 @@
+-- ============================================
+-- ANTIKYTHERA F1 VIDEO GENERATOR
+-- News Articles URL Hash
+-- Version: 014
+-- Date: 2026-10-15
+-- ============================================
+-- Deduplicates articles on a 16-byte MD5 of the URL instead
+-- of a unique btree over the URL itself (up to 1000 bytes
+-- per entry). The application computes the same digest.
+-- ============================================
+
+ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS url_hash BYTEA;
+
+UPDATE news_articles SET url_hash = decode(md5(url), 'hex') WHERE url_hash IS NULL;
+
+ALTER TABLE news_articles ALTER COLUMN url_hash SET NOT NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_news_articles_url_hash ON news_articles(url_hash);
+
+ALTER TABLE news_articles DROP CONSTRAINT IF EXISTS news_articles_url_key;
+
+-- ============================================
+-- MIGRATION RECORD
+-- ============================================
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('014', 'Deduplicate news articles on an MD5 hash of the URL')
+ON CONFLICT (version) DO NOTHING;
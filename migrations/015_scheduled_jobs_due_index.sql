@@ -0,0 +1,22 @@
+-- ============================================
+-- ANTIKYTHERA F1 VIDEO GENERATOR
+-- Scheduled Jobs Due Index
+-- Version: 015
+-- Date: 2026-10-15
+-- ============================================
+-- Partial index for the scheduler poll (status = 'scheduled'
+-- AND scheduled_for <= now ORDER BY scheduled_for). Only
+-- pending jobs are indexed; completed history is skipped.
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_scheduled_jobs_due
+    ON scheduled_jobs(scheduled_for)
+    WHERE status = 'scheduled';
+
+-- ============================================
+-- MIGRATION RECORD
+-- ============================================
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('015', 'Partial index for due scheduled jobs')
+ON CONFLICT (version) DO NOTHING;
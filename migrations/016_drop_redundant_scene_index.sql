@@ -0,0 +1,21 @@
+-- ============================================
+-- ANTIKYTHERA F1 VIDEO GENERATOR
+-- Drop Redundant Scene Index
+-- Version: 016
+-- Date: 2026-10-15
+-- ============================================
+-- The UNIQUE (episode_id, scene_number) index already serves
+-- episode_id lookups and returns an episode's scenes in
+-- scene_number order (the stitch query), so the single-column
+-- episode_id index only adds write cost.
+-- ============================================
+
+DROP INDEX IF EXISTS idx_episode_scenes_episode;
+
+-- ============================================
+-- MIGRATION RECORD
+-- ============================================
+
+INSERT INTO schema_migrations (version, description)
+VALUES ('016', 'Drop episode_scenes episode_id index covered by the unique key')
+ON CONFLICT (version) DO NOTHING;